@@ -2379,10 +2379,11 @@ class CrossrefReviewScraper:
         if not records:
             return 0
 
+        known_dois = db.existing_dois(record.get('DOI', '') for record in records)
         new_records = []
         for record in records:
             doi = record.get('DOI', '')
-            if doi and db.doi_exists(doi):
+            if doi in known_dois:
                 self.stats['duplicates_skipped'] += 1
                 continue
             # Remove internal metadata keys
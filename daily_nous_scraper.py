@@ -18,20 +18,41 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import json
+import os
 import re
-import time
+import sys
+from dataclasses import asdict, dataclass
 from datetime import datetime
 
 import requests
 from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import db
+from rate_limit import RateLimiter
+
+# update.py runs this under launchd's system python3, which may not have
+# orjson; json.loads parses the same bytes, just slower
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 WP_API = "https://dailynous.com/wp-json/wp/v2/posts"
+STATE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "daily_nous_state.json"
+)
 SLUG_PREFIX = "online-philosophy-resources-weekly-update"
 USER_AGENT = (
     "PhilReviews/2.0 (academic research aggregator; mailto:mzwolinski@sandiego.edu)"
 )
+# Daily Nous is a small WordPress site: few page fetches in flight, paced
+WP_WORKERS = 2
+WP_RATE = 2  # requests/sec across all threads
 
 # Patterns for the section header
 HEADER_PATTERNS = [
@@ -41,6 +62,87 @@ HEADER_PATTERNS = [
     ),
 ]
 
+SMART_QUOTES = str.maketrans(
+    {"\u2019": "'", "\u2018": "'", "\u201c": '"', "\u201d": '"'}
+)
+
+# Entry-format markers, classified in a single scan. Each branch is a
+# lookahead so overlapping phrasings (e.g. "is reviewed by" also contains
+# the possessive ", reviewed by") are all reported. Matched against
+# lower-cased text, so no IGNORECASE.
+FORMAT_PATTERN = re.compile(
+    r"(?=(?P<multi_book>are\s+(?:together\s+)?reviewed\s+by))"
+    r"|(?=(?P<passive>is\s+reviewed\s+(?:by|at)\b))"
+    r"|(?=(?P<active>\breviews?\s+))"
+    r"|(?=(?P<possessive>,?\s+reviewed\s+by\b))"
+)
+
+
+@dataclass
+class ReviewRecord:
+    """A parsed review; field names match db.insert_reviews() columns."""
+
+    book_title: str
+    book_author_first_name: str
+    book_author_last_name: str
+    reviewer_first_name: str
+    reviewer_last_name: str
+    publication_source: str
+    publication_date: str
+    review_link: str
+    review_summary: str = ""
+    access_type: str = "Open"
+    doi: str = ""
+    entry_type: str = "review"
+    symposium_group: str = ""
+
+
+# ── Name helpers ──────────────────────────────────────────────────
+# Pure functions of their input, memoized because the same authors and
+# reviewers recur across many Weekly Update posts.
+
+@functools.lru_cache(maxsize=8192)
+def _clean_author(author_str):
+    """Strip 'translated by X', 'edited by X', etc. from author strings."""
+    if not author_str:
+        return ""
+    author_str = re.sub(
+        r",?\s+translated\s+by\s+.+$", "", author_str, flags=re.IGNORECASE
+    )
+    author_str = re.sub(
+        r",?\s+edited\s+by\s+.+$", "", author_str, flags=re.IGNORECASE
+    )
+    # Strip trailing "and" fragments from multi-book splitting
+    author_str = re.sub(r"\s+and\s*$", "", author_str).strip()
+    return author_str
+
+
+@functools.lru_cache(maxsize=8192)
+def _split_name(full_name):
+    """Split 'First Last' into (first, last). Multi-word: everything
+    except last word goes into first_name."""
+    full_name = full_name.strip().rstrip(",.")
+    if not full_name:
+        return ("", "")
+    parts = full_name.split()
+    if len(parts) == 1:
+        return ("", parts[0])
+    return (" ".join(parts[:-1]), parts[-1])
+
+
+def load_state():
+    """Load saved HTTP validators (ETag / Last-Modified) from the state file."""
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    """Persist HTTP validators for the next run."""
+    with open(STATE_FILE, "w") as f:
+        json.dump(state, f, indent=2)
+
 
 class DailyNousScraper:
     """Scrapes book review listings from Daily Nous weekly update posts."""
@@ -48,6 +150,19 @@ class DailyNousScraper:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.limiter = RateLimiter(WP_RATE)
+        self.validators = {}  # query key -> {"etag", "last_modified"}
         self.stats = {
             "posts_fetched": 0,
             "posts_with_reviews": 0,
@@ -64,28 +179,62 @@ class DailyNousScraper:
 
     # ── Post discovery via WP REST API ─────────────────────────────
 
-    def _api_get(self, params, max_pages=None):
-        """Fetch posts from WP REST API with pagination."""
-        all_posts = []
-        page = 1
-        while True:
-            params_page = {**params, "page": page}
-            resp = self.session.get(WP_API, params=params_page, timeout=30)
+    def _api_get(self, params, max_pages=None, conditional=None):
+        """Fetch posts from WP REST API with pagination.
+
+        Page 1 is fetched first to learn X-WP-TotalPages; the remaining
+        pages are then requested by WP_WORKERS threads over the pooled
+        session, paced to WP_RATE requests per second.
+
+        ``conditional`` is a dict of validators from a previous response;
+        page 1 is then sent as a conditional GET and an unchanged listing
+        (304) returns []. Page 1's validators are returned in
+        ``self.last_validators``.
+        """
+        headers = {}
+        if conditional:
+            if conditional.get("etag"):
+                headers["If-None-Match"] = conditional["etag"]
+            if conditional.get("last_modified"):
+                headers["If-Modified-Since"] = conditional["last_modified"]
+        self.last_validators = {}
+
+        def fetch_page(page):
+            self.limiter.wait()
+            resp = self.session.get(
+                WP_API,
+                params={**params, "page": page},
+                headers=headers if page == 1 else None,
+                timeout=30,
+            )
+            if resp.status_code == 304:
+                self.log("No new posts since last run (304 Not Modified)")
+                return [], 0
             if resp.status_code == 400:
                 # WP returns 400 when page > total_pages
-                break
+                return [], 0
             resp.raise_for_status()
-            posts = resp.json()
-            if not posts:
-                break
-            all_posts.extend(posts)
-            total_pages = int(resp.headers.get("X-WP-TotalPages", 1))
-            if page >= total_pages:
-                break
-            if max_pages and page >= max_pages:
-                break
-            page += 1
-            time.sleep(1)
+            if page == 1:
+                self.last_validators = {
+                    "etag": resp.headers.get("ETag", ""),
+                    "last_modified": resp.headers.get("Last-Modified", ""),
+                }
+            posts = json_loads(resp.content)
+            return posts, int(resp.headers.get("X-WP-TotalPages", 1))
+
+        all_posts, total_pages = fetch_page(1)
+        if not all_posts:
+            return []
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        if total_pages <= 1:
+            return all_posts
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(WP_WORKERS, total_pages - 1)
+        ) as ex:
+            for posts, _ in ex.map(fetch_page, range(2, total_pages + 1)):
+                all_posts.extend(posts)
         return all_posts
 
     def fetch_all_posts(self):
@@ -108,6 +257,7 @@ class DailyNousScraper:
     def fetch_recent_posts(self, count=5):
         """Fetch the N most recent Weekly Update posts (incremental)."""
         self.log(f"Fetching {count} most recent Weekly Update posts...")
+        key = f"recent:{count}"
         posts = self._api_get(
             {
                 "search": "online philosophy resources weekly update",
@@ -117,7 +267,10 @@ class DailyNousScraper:
                 "_fields": "id,date,slug,link,content",
             },
             max_pages=1,
+            conditional=load_state().get(key),
         )
+        if any(self.last_validators.values()):
+            self.validators[key] = self.last_validators
         posts = [p for p in posts if p.get("slug", "").startswith(SLUG_PREFIX)]
         return posts
 
@@ -128,6 +281,11 @@ class DailyNousScraper:
 
         Returns the <ol> BeautifulSoup element, or None if not found.
         """
+        # Every header pattern contains "book reviews"; skip the parse
+        # entirely when the phrase can't be present.
+        if "Book Reviews" not in html and "book reviews" not in html.lower():
+            return None
+
         soup = BeautifulSoup(html, "html.parser")
 
         # Strategy: find any element whose text matches a header pattern,
@@ -141,28 +299,31 @@ class DailyNousScraper:
                     start = el
                     if el.name == "strong" and el.parent and el.parent.name == "p":
                         start = el.parent
-                    for sib in start.next_siblings:
-                        if isinstance(sib, Tag) and sib.name == "ol":
-                            return sib
-                    return None
+                    return start.find_next_sibling("ol")
         return None
 
     def _parse_li(self, li, post_date):
-        """Parse a single <li> element into a list of review dicts.
+        """Parse a single <li> element into a list of ReviewRecords.
 
         Returns a list because multi-book reviews produce multiple records.
         """
-        text = li.get_text(" ", strip=True)
-        text = re.sub(r"\s+", " ", text).strip()
-        # Normalize smart quotes to straight quotes for consistent parsing
-        text = text.replace("\u2019", "'").replace("\u2018", "'")
-        text = text.replace("\u201c", '"').replace("\u201d", '"')
+        # Collapse whitespace and normalize smart quotes to straight quotes
+        # for consistent parsing
+        text = " ".join(li.get_text(" ", strip=True).split())
+        text = text.translate(SMART_QUOTES)
 
         if not text or len(text) < 10:
             return []
 
-        # Find all <a> elements and their hrefs
-        all_links = li.find_all("a", href=True)
+        # Collect <a href> and <em> elements in a single traversal
+        all_links = []
+        all_em = []
+        for node in li.descendants:
+            if isinstance(node, Tag):
+                if node.name == "a" and node.has_attr("href"):
+                    all_links.append(node)
+                elif node.name == "em":
+                    all_em.append(node)
 
         # Separate Amazon links from review/venue links, skip punctuation-only links
         non_amazon = [
@@ -175,14 +336,38 @@ class DailyNousScraper:
         if not non_amazon:
             return []
 
-        # Find all <em> elements and their cleaned texts
-        all_em = li.find_all("em")
+        # Cleaned <em> texts
         em_texts = [em.get_text(strip=True).strip("., ") for em in all_em]
         em_texts = [t for t in em_texts if t]  # drop empty
 
         if not em_texts:
             return []
 
+        # Fast path for the common "Title by Author is reviewed by Reviewer
+        # at Venue" entry: one book, one review link, passive phrasing. The
+        # general path below reaches the same _parse_passive call.
+        if len(em_texts) == 2 and len(non_amazon) == 1:
+            title, venue_name = em_texts
+            lowered = text.lower()
+            if (
+                title != venue_name
+                and len(title) > 5
+                and ("is reviewed by " in lowered or "is reviewed at " in lowered)
+                and "are reviewed by" not in lowered
+                and "are together reviewed by" not in lowered
+            ):
+                return self._parse_passive(
+                    text, [title], venue_name,
+                    non_amazon[0].get("href", "").strip(), post_date,
+                )
+
+        # O(1) lookups for the venue loops below (first index wins, as with
+        # list.index)
+        em_index = {}
+        for i, t in enumerate(em_texts):
+            em_index.setdefault(t, i)
+        inner_em = set(em_texts[:-1])
+
         # Venue detection: the venue is always the LAST <em> text
         # (venue names like "The Atlantic", "TLS" always appear at the end)
         venue_name = em_texts[-1]
@@ -196,7 +381,7 @@ class DailyNousScraper:
                 vn = em.get_text(strip=True).strip("., ")
                 # Only count as venue link if the <em> text matches a known
                 # venue (appears at end) or is short enough to be a venue
-                if vn and vn not in em_texts[:-1]:
+                if vn and vn not in inner_em:
                     # It's a venue, not a book title in the middle
                     pass
                 if vn == venue_name:
@@ -217,10 +402,10 @@ class DailyNousScraper:
                 em = a.find("em")
                 if em:
                     vn = em.get_text(strip=True).strip("., ")
-                    if vn and vn != venue_name and vn in em_texts:
+                    if vn and vn != venue_name and vn in em_index:
                         # Check if this <em> appears at/near the end (likely a venue)
                         # by seeing if it's one of the last 2 em_texts
-                        idx = em_texts.index(vn) if vn in em_texts else -1
+                        idx = em_index[vn]
                         if idx >= len(em_texts) - 2:
                             venue_links.insert(0, (a.get("href", "").strip(), vn))
                             venue_names.add(vn)
@@ -307,8 +492,8 @@ class DailyNousScraper:
             text,
             re.IGNORECASE,
         )
-        author_str = self._clean_author(am.group(1).strip().rstrip(",")) if am else ""
-        a_first, a_last = self._split_name(author_str)
+        author_str = _clean_author(am.group(1).strip().rstrip(",")) if am else ""
+        a_first, a_last = _split_name(author_str)
 
         # Match each "reviewer at venue_name" pair by searching for the known venue names
         reviewer_map = {}  # venue_name -> reviewer
@@ -336,7 +521,7 @@ class DailyNousScraper:
         records = []
         for url, vname in venue_links:
             reviewer_str = reviewer_map.get(vname, "")
-            r_first, r_last = self._split_name(reviewer_str)
+            r_first, r_last = _split_name(reviewer_str)
             records.append(
                 self._make_record(
                     title, a_first, a_last, r_first, r_last,
@@ -351,9 +536,10 @@ class DailyNousScraper:
         Handles passive, active, and multi-book formats.
         """
         records = []
+        formats = {m.lastgroup for m in FORMAT_PATTERN.finditer(text.lower())}
 
         # Detect multi-book: "are (together) reviewed by"
-        if re.search(r"are\s+(together\s+)?reviewed\s+by", text, re.IGNORECASE):
+        if "multi_book" in formats:
             records = self._parse_multi_book(
                 text, book_titles, venue_name, review_url, post_date
             )
@@ -362,7 +548,7 @@ class DailyNousScraper:
                 return records
 
         # Detect passive format: "is reviewed by" or "is reviewed at" (no reviewer)
-        if re.search(r"is\s+reviewed\s+(by|at)\b", text, re.IGNORECASE):
+        if "passive" in formats:
             records = self._parse_passive(
                 text, book_titles, venue_name, review_url, post_date
             )
@@ -370,7 +556,7 @@ class DailyNousScraper:
                 return records
 
         # Detect active format: "X reviews Y"
-        if re.search(r"\breviews?\s+", text.lower()):
+        if "active" in formats:
             records = self._parse_active(
                 text, book_titles, venue_name, review_url, post_date
             )
@@ -378,7 +564,7 @@ class DailyNousScraper:
                 return records
 
         # Detect possessive format: "Author's Title, reviewed by R in/at V"
-        if re.search(r",?\s+reviewed\s+by\b", text, re.IGNORECASE):
+        if "possessive" in formats:
             records = self._parse_possessive(
                 text, book_titles, venue_name, review_url, post_date
             )
@@ -416,10 +602,10 @@ class DailyNousScraper:
         )
         am = re.search(a_pattern, text, re.IGNORECASE)
         if am:
-            author_str = self._clean_author(am.group(1).strip().rstrip(","))
+            author_str = _clean_author(am.group(1).strip().rstrip(","))
         else:
             author_str = ""
-        a_first, a_last = self._split_name(author_str)
+        a_first, a_last = _split_name(author_str)
 
         # Extract reviewer: "is reviewed by Reviewer at/in"
         # May be absent ("is reviewed at Venue" with no reviewer)
@@ -429,7 +615,7 @@ class DailyNousScraper:
             reviewer_str = rm.group(1).strip().rstrip(",")
         else:
             reviewer_str = ""
-        r_first, r_last = self._split_name(reviewer_str)
+        r_first, r_last = _split_name(reviewer_str)
 
         return [
             self._make_record(
@@ -460,9 +646,9 @@ class DailyNousScraper:
             return []
         author_str = am.group(1).strip().rstrip(",")
 
-        author_str = self._clean_author(author_str)
-        a_first, a_last = self._split_name(author_str)
-        r_first, r_last = self._split_name(reviewer_str)
+        author_str = _clean_author(author_str)
+        a_first, a_last = _split_name(author_str)
+        r_first, r_last = _split_name(reviewer_str)
 
         return [
             self._make_record(
@@ -492,9 +678,9 @@ class DailyNousScraper:
         )
         reviewer_str = rm.group(1).strip().rstrip(",") if rm else ""
 
-        author_str = self._clean_author(author_str)
-        a_first, a_last = self._split_name(author_str)
-        r_first, r_last = self._split_name(reviewer_str)
+        author_str = _clean_author(author_str)
+        a_first, a_last = _split_name(author_str)
+        r_first, r_last = _split_name(reviewer_str)
 
         return [
             self._make_record(
@@ -516,7 +702,7 @@ class DailyNousScraper:
         if not rm:
             return []
         reviewer_str = rm.group(1).strip().rstrip(",")
-        r_first, r_last = self._split_name(reviewer_str)
+        r_first, r_last = _split_name(reviewer_str)
 
         # Text before "are (together) reviewed"
         before = text[: rm.start()].strip()
@@ -531,8 +717,8 @@ class DailyNousScraper:
                 re.IGNORECASE,
             )
             if am:
-                author_str = self._clean_author(am.group(1).strip().rstrip(","))
-                a_first, a_last = self._split_name(author_str)
+                author_str = _clean_author(am.group(1).strip().rstrip(","))
+                a_first, a_last = _split_name(author_str)
             else:
                 a_first, a_last = "", ""
 
@@ -550,8 +736,8 @@ class DailyNousScraper:
         title_pat = r"[\s,]*\s+".join(re.escape(w) for w in title.split())
         # Try to find "by Author" after the title
         am = re.search(title_pat + r",?\s+by\s+(.+?)(?:\s+at\s+|$)", text, re.IGNORECASE)
-        author_str = self._clean_author(am.group(1).strip().rstrip(",")) if am else ""
-        a_first, a_last = self._split_name(author_str) if author_str else ("", "")
+        author_str = _clean_author(am.group(1).strip().rstrip(",")) if am else ""
+        a_first, a_last = _split_name(author_str) if author_str else ("", "")
 
         return [
             self._make_record(
@@ -560,30 +746,7 @@ class DailyNousScraper:
             )
         ]
 
-    # ── Name and text helpers ──────────────────────────────────────
-
-    def _clean_author(self, author_str):
-        """Strip 'translated by X', 'edited by X', etc. from author strings."""
-        author_str = re.sub(
-            r",?\s+translated\s+by\s+.+$", "", author_str, flags=re.IGNORECASE
-        )
-        author_str = re.sub(
-            r",?\s+edited\s+by\s+.+$", "", author_str, flags=re.IGNORECASE
-        )
-        # Strip trailing "and" fragments from multi-book splitting
-        author_str = re.sub(r"\s+and\s*$", "", author_str).strip()
-        return author_str
-
-    def _split_name(self, full_name):
-        """Split 'First Last' into (first, last). Multi-word: everything
-        except last word goes into first_name."""
-        full_name = full_name.strip().rstrip(",.")
-        if not full_name:
-            return ("", "")
-        parts = full_name.split()
-        if len(parts) == 1:
-            return ("", parts[0])
-        return (" ".join(parts[:-1]), parts[-1])
+    # ── Record helpers ─────────────────────────────────────────────
 
     # Normalize common venue name variants
     VENUE_ALIASES = {
@@ -602,31 +765,27 @@ class DailyNousScraper:
         self, title, a_first, a_last, r_first, r_last,
         venue, review_url, post_date,
     ):
-        """Create a dict matching db.insert_reviews() column names."""
+        """Create a ReviewRecord; venue strings are interned since a handful
+        of outlets repeat across thousands of records."""
         venue = venue.strip(". ")
-        venue = self.VENUE_ALIASES.get(venue, venue)
-        return {
-            "book_title": title.strip(),
-            "book_author_first_name": a_first.strip(),
-            "book_author_last_name": a_last.strip(),
-            "reviewer_first_name": r_first.strip(),
-            "reviewer_last_name": r_last.strip(),
-            "publication_source": venue,
-            "publication_date": post_date,
-            "review_link": review_url.strip(),
-            "review_summary": "",
-            "access_type": "Open",
-            "doi": "",
-            "entry_type": "review",
-            "symposium_group": "",
-        }
+        venue = sys.intern(self.VENUE_ALIASES.get(venue, venue))
+        return ReviewRecord(
+            book_title=title.strip(),
+            book_author_first_name=a_first.strip(),
+            book_author_last_name=a_last.strip(),
+            reviewer_first_name=r_first.strip(),
+            reviewer_last_name=r_last.strip(),
+            publication_source=venue,
+            publication_date=post_date,
+            review_link=review_url.strip(),
+        )
 
     # ── Processing pipeline ────────────────────────────────────────
 
     def process_post(self, post):
         """Extract reviews from a single WP API post dict.
 
-        Returns a list of review record dicts.
+        Returns a list of ReviewRecords.
         """
         content = post.get("content", {}).get("rendered", "")
         post_date = post.get("date", "")[:10]  # YYYY-MM-DD
@@ -649,49 +808,66 @@ class DailyNousScraper:
         return records
 
     def upload_to_db(self, records):
-        """Deduplicate and batch-insert records into the database."""
-        new_records = []
-        for r in records:
-            link = r.get("review_link", "").strip()
-            if link and not db.review_link_exists(link):
-                new_records.append(r)
-            else:
-                self.stats["duplicates_skipped"] += 1
-
+        """Batch-insert records; the unique review_link index drops duplicates."""
+        new_records = [r for r in records if r.review_link.strip()]
+        self.stats["duplicates_skipped"] += len(records) - len(new_records)
+        inserted = 0
         if new_records:
-            db.insert_reviews(new_records)
-        self.stats["uploaded"] = len(new_records)
-        return len(new_records)
+            inserted = db.insert_reviews([asdict(r) for r in new_records])
+        self.stats["duplicates_skipped"] += len(new_records) - inserted
+        self.stats["uploaded"] += inserted
+        return inserted
+
+    def run_bulk(self, dry_run=False, limit=None, batch_size=500):
+        """Fetch and process all Weekly Update posts (initial import).
 
-    def run_bulk(self, dry_run=False, limit=None):
-        """Fetch and process all Weekly Update posts (initial import)."""
+        Records are flushed to the database every ``batch_size`` reviews
+        rather than held in memory until the end.
+        """
         posts = self.fetch_all_posts()
         if limit:
             posts = posts[:limit]
         self.stats["posts_fetched"] = len(posts)
 
-        all_records = []
-        for i, post in enumerate(posts):
-            slug = post.get("slug", "")
-            records = self.process_post(post)
-            if records:
-                all_records.extend(records)
+        batch = []
+        sample = []
+        total_parsed = 0
+        # Parsing is CPU-bound and posts are independent, so fan them out
+        # across processes; stats deltas are merged back here.
+        with concurrent.futures.ProcessPoolExecutor() as ex:
+            results = ex.map(_process_post_worker, posts, chunksize=8)
+            for i, (post, (records, stats_delta)) in enumerate(zip(posts, results)):
+                for key, n in stats_delta.items():
+                    self.stats[key] += n
+                if not records:
+                    continue
+                total_parsed += len(records)
                 self.log(
-                    f"  [{i + 1}/{len(posts)}] {slug}: {len(records)} reviews"
+                    f"  [{i + 1}/{len(posts)}] {post.get('slug', '')}: "
+                    f"{len(records)} reviews"
                 )
-
-        self.stats["reviews_parsed"] = len(all_records)
+                if dry_run:
+                    sample.extend(records[:10 - len(sample)])
+                    continue
+                batch.extend(records)
+                if len(batch) >= batch_size:
+                    self.upload_to_db(batch)
+                    batch.clear()
+
+        if batch:
+            self.upload_to_db(batch)
+
+        self.stats["reviews_parsed"] = total_parsed
         self.log(
-            f"Parsed {len(all_records)} reviews from "
+            f"Parsed {total_parsed} reviews from "
             f"{self.stats['posts_with_reviews']}/{len(posts)} posts"
         )
 
         if dry_run:
             self.log("Dry run — skipping database upload")
-            self._print_sample(all_records)
+            self._print_sample(sample)
         else:
-            uploaded = self.upload_to_db(all_records)
-            self.log(f"Uploaded {uploaded} new reviews, "
+            self.log(f"Uploaded {self.stats['uploaded']} new reviews, "
                      f"skipped {self.stats['duplicates_skipped']} duplicates")
 
         return self.stats
@@ -711,6 +887,13 @@ class DailyNousScraper:
         if all_records and not dry_run:
             self.upload_to_db(all_records)
 
+        # Only remember validators once the posts have actually been stored,
+        # so a dry run or failed upload doesn't turn the next poll into a 304
+        if self.validators and not dry_run:
+            state = load_state()
+            state.update(self.validators)
+            save_state(state)
+
         self.log(
             f"Incremental: {len(all_records)} reviews from {len(posts)} posts, "
             f"{self.stats['uploaded']} new"
@@ -721,17 +904,37 @@ class DailyNousScraper:
         """Print a sample of parsed records for dry-run review."""
         self.log(f"Sample of first {min(n, len(records))} records:")
         for r in records[:n]:
-            author = f"{r['book_author_first_name']} {r['book_author_last_name']}".strip()
-            reviewer = f"{r['reviewer_first_name']} {r['reviewer_last_name']}".strip()
+            author = f"{r.book_author_first_name} {r.book_author_last_name}".strip()
+            reviewer = f"{r.reviewer_first_name} {r.reviewer_last_name}".strip()
             print(
-                f"  {r['book_title']}"
+                f"  {r.book_title}"
                 f" | by {author or '?'}"
                 f" | reviewed by {reviewer or '?'}"
-                f" | {r['publication_source']}"
-                f" | {r['publication_date']}"
+                f" | {r.publication_source}"
+                f" | {r.publication_date}"
             )
 
 
+_worker_scraper = None
+
+
+def _process_post_worker(post):
+    """Process-pool entry point for DailyNousScraper.process_post.
+
+    Each worker process keeps its own scraper; returns (records, stats_delta)
+    so the parent can merge counters.
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = DailyNousScraper()
+    before = dict(_worker_scraper.stats)
+    records = _worker_scraper.process_post(post)
+    stats_delta = {
+        k: v - before[k] for k, v in _worker_scraper.stats.items() if v != before[k]
+    }
+    return records, stats_delta
+
+
 def main():
     parser = argparse.ArgumentParser(description="Daily Nous book review scraper")
     parser.add_argument(
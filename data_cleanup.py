@@ -7,44 +7,259 @@ One-time data quality sweep:
 4. Update the database
 """
 
+import argparse
+import atexit
+import functools
+import os
 import re
 import sys
 import time
 import sqlite3
+import zlib
+import orjson
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from crossref_scraper import parse_review_title, _looks_like_author_name, _extract_first_author, is_book_review
+from rate_limit import RateLimiter
 
 DB_PATH = 'reviews.db'
 SESSION = requests.Session()
 SESSION.headers['User-Agent'] = 'PhilReviews/1.0 (mailto:mzwolinski@sandiego.edu)'
+CROSSREF_BATCH = 40  # DOIs per filter=doi: request
+CROSSREF_WORKERS = 8  # concurrent single-DOI fallback fetches
+CROSSREF_RATE = 10  # requests/sec across all threads
+OPEN_LIBRARY_RATE = 2  # requests/sec
+CLEAN_POOL_MIN = 2000  # titles before clean_title is worth spreading over processes
+CROSSREF_CACHE_TTL = 30 * 24 * 3600  # seconds before a cached work record is re-fetched
+# Fields the bulk query asks for; parse_review_title only reads the title/subtitle
+CROSSREF_SELECT = 'DOI,title,subtitle,author,container-title,type'
 
+_conn = None
+_refresh_cache = False  # --refresh: ignore crossref_cache hits (still rewrites them)
 
-def get_missing_author_entries():
-    """Get all entries with missing book authors."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
+
+def get_conn():
+    """Shared connection for the sweep, tuned for bulk updates.
+
+    update_entry() doesn't commit; each fix step commits at the end (and the
+    network-bound ones every 100 rows) instead of once per row.
+    """
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute('PRAGMA journal_mode=WAL')
+        _conn.execute('PRAGMA synchronous=NORMAL')
+        _conn.execute('PRAGMA temp_store=MEMORY')
+        _conn.execute('PRAGMA cache_size=-200000')  # KiB, ~200 MB
+        _conn.execute('PRAGMA mmap_size=268435456')
+        # Closing checkpoints the WAL back into reviews.db and removes the
+        # -wal/-shm files; uncommitted work is still rolled back
+        atexit.register(_conn.close)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS crossref_cache ("
+            "doi TEXT PRIMARY KEY, json BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+    return _conn
+
+
+# Partial indexes covering just the rows the sweep's SELECTs look for; they
+# exist only while main() runs, so scraper inserts don't maintain them
+_SWEEP_INDEXES = {
+    'idx_missing_author': "WHERE book_author_last_name IS NULL OR book_author_last_name = ''",
+    'idx_long_title': 'WHERE LENGTH(book_title) > 150',
+}
+
+
+def _ensure_indexes(conn):
+    for name, where in _SWEEP_INDEXES.items():
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON reviews(id) {where}')
+    conn.commit()
+
+
+def _drop_indexes(conn):
+    for name in _SWEEP_INDEXES:
+        conn.execute(f'DROP INDEX IF EXISTS {name}')
+    conn.commit()
+
+
+_MISSING_AUTHOR_SQL = "(book_author_last_name IS NULL OR book_author_last_name = '')"
+_HAS_DOI_SQL = "doi IS NOT NULL AND doi != ''"
+_NO_DOI_SQL = "(doi IS NULL OR doi = '')"
+
+
+def get_missing_author_entries(with_doi=False):
+    """Yield entries with missing book authors, one sqlite3.Row at a time.
+
+    with_doi=True limits the scan to entries Crossref can be asked about.
+    """
+    sql = (
         "SELECT id, doi, book_title, book_author_first_name, book_author_last_name, "
-        "publication_source FROM reviews "
-        "WHERE (book_author_last_name IS NULL OR book_author_last_name = '')"
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+        "publication_source, publication_date FROM reviews "
+        f"WHERE {_MISSING_AUTHOR_SQL}"
+    )
+    if with_doi:
+        sql += f" AND {_HAS_DOI_SQL}"
+    yield from get_conn().execute(sql)
 
 
-def fetch_crossref_title(doi):
-    """Fetch the raw title from Crossref for a given DOI."""
+def _first(data, key):
+    """First element of a Crossref list field, or '' if missing/empty."""
+    value = data.get(key)
+    return value[0] if value else ''
+
+
+def _title_fields(data):
+    """Pull (raw_title, subtitle, data) out of a Crossref work record."""
+    return _first(data, 'title'), _first(data, 'subtitle'), data
+
+
+CROSSREF_LIMIT = RateLimiter(CROSSREF_RATE)
+OPEN_LIBRARY_LIMIT = RateLimiter(OPEN_LIBRARY_RATE)
+
+
+def _cache_lookup(dois):
+    """Return {doi: work record} for DOIs with a fresh crossref_cache entry."""
+    if not dois or _refresh_cache:
+        return {}
+    wanted = {d.lower(): d for d in dois}
+    cutoff = int(time.time()) - CROSSREF_CACHE_TTL
+    placeholders = ','.join('?' * len(wanted))
+    rows = get_conn().execute(
+        f"SELECT doi, json FROM crossref_cache "
+        f"WHERE doi IN ({placeholders}) AND fetched_at >= ?",
+        (*wanted, cutoff),
+    )
+    return {wanted[r['doi']]: orjson.loads(zlib.decompress(r['json'])) for r in rows}
+
+
+def _cache_store(records):
+    """Save {doi: work record} to crossref_cache (committed with the fix step)."""
+    now = int(time.time())
+    get_conn().executemany(
+        "INSERT OR REPLACE INTO crossref_cache (doi, json, fetched_at) VALUES (?, ?, ?)",
+        [(doi.lower(), zlib.compress(orjson.dumps(data)), now)
+         for doi, data in records.items()],
+    )
+
+
+def _fetch_crossref_work(doi):
+    """GET a single Crossref work record. Touches no SQLite, so it is safe in worker threads."""
     try:
+        CROSSREF_LIMIT.wait()
         resp = SESSION.get(f'https://api.crossref.org/works/{doi}', timeout=15)
         if resp.status_code == 200:
-            data = resp.json()['message']
-            raw_title = data.get('title', [''])[0]
-            subtitle = data.get('subtitle', [''])[0] if data.get('subtitle') else ''
-            return raw_title, subtitle, data
-        return None, None, None
+            return orjson.loads(resp.content)['message']
+        return None
     except Exception as e:
         print(f'  Error fetching {doi}: {e}')
-        return None, None, None
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def fetch_crossref_title(doi):
+    """Fetch the raw title from Crossref for a given DOI, via crossref_cache."""
+    data = _cache_lookup([doi]).get(doi)
+    if data is None:
+        data = _fetch_crossref_work(doi)
+        if data is None:
+            return None, None, None
+        _cache_store({doi: data})
+    return _title_fields(data)
+
+
+def fetch_crossref_titles_bulk(dois, chunk=CROSSREF_BATCH):
+    """Fetch raw titles for many DOIs with Crossref's filter=doi: query.
+
+    One request covers up to `chunk` DOIs (kept small to stay under URL
+    length limits). DOIs a batch doesn't return (or a failed batch) fall back
+    to concurrent single-DOI fetches on the shared session. Records already in
+    crossref_cache (and younger than CROSSREF_CACHE_TTL) skip HTTP entirely;
+    everything fetched is written back. Returns
+    {doi: (raw_title, subtitle, data)} keyed by the DOIs passed in; DOIs that
+    still can't be fetched are omitted.
+    """
+    records = _cache_lookup(dois)
+    to_fetch = [d for d in dois if d not in records]
+    fetched = {}
+    for i in range(0, len(to_fetch), chunk):
+        batch = to_fetch[i:i + chunk]
+        wanted = {d.lower(): d for d in batch}
+        try:
+            CROSSREF_LIMIT.wait()
+            resp = SESSION.get('https://api.crossref.org/works', params={
+                'filter': ','.join(f'doi:{d}' for d in batch),
+                'rows': len(batch),
+                'select': CROSSREF_SELECT,
+            }, timeout=30)
+            if resp.status_code != 200:
+                print(f'  Crossref returned {resp.status_code} for a batch of {len(batch)} DOIs')
+                continue
+            items = orjson.loads(resp.content)['message']['items']
+        except Exception as e:
+            print(f'  Error fetching batch of {len(batch)} DOIs: {e}')
+            continue
+        for data in items:
+            doi = wanted.get(data.get('DOI', '').lower())
+            if doi:
+                fetched[doi] = data
+
+    missing = [d for d in to_fetch if d not in fetched]
+    if missing:
+        with ThreadPoolExecutor(max_workers=CROSSREF_WORKERS) as ex:
+            for doi, data in zip(missing, ex.map(_fetch_crossref_work, missing)):
+                if data is not None:
+                    fetched[doi] = data
+    _cache_store(fetched)
+    records.update(fetched)
+
+    results = {}
+    for doi, data in records.items():
+        fields = _title_fields(data)
+        if fields[0]:
+            results[doi] = fields
+    return results
+
+
+# Garbled-author detection patterns, compiled once at import
+
+_ISBN_AUTHOR_RE = re.compile(r'ISBN|978[-\d]|97[89]\d|0-\d{3,}', re.IGNORECASE)
+_PUBLISHER_AUTHOR_RE = re.compile(
+    r'\bPress\b|\bUniversity\b|\bPublisher|\bVerlag\b|\bEditions?\b|\bPresses\b', re.IGNORECASE)
+_PAGES_AUTHOR_RE = re.compile(r'\bpp\.|\bpages\b|\bPp\b', re.IGNORECASE)
+_PRICE_AUTHOR_RE = re.compile(r'[\$£€]\d|dollars?|\bRs\.', re.IGNORECASE)
+_YEAR_PAREN_RE = re.compile(r'\b(?:19|20)\d{2}\)')
+_BINDING_RE = re.compile(r'\bHardcover\b|\bPaperback\b|\bHbk\b|\bPbk\b', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+# Any hit means garbled, so each group of checks is one alternation: ISBNs,
+# prices and "(year)" always; publisher/pages/binding words only for
+# non-ASCII names (ASCII ones use the token set below).
+_GARBLED_AUTHOR_RE = re.compile('|'.join(
+    p.pattern for p in (_ISBN_AUTHOR_RE, _PRICE_AUTHOR_RE, _YEAR_PAREN_RE)), re.IGNORECASE)
+_GARBLED_WORDS_RE = re.compile('|'.join(
+    p.pattern for p in (_PUBLISHER_AUTHOR_RE, _PAGES_AUTHOR_RE, _BINDING_RE)), re.IGNORECASE)
+# Whole-word versions of the publisher/pages/binding patterns above, for ASCII
+# names: \w+ tokens have the same edges as \b, so set membership is exact.
+# \bPublisher is a prefix match and is checked with startswith().
+_WORD_RE = re.compile(r'\w+')
+_GARBLED_WORDS = frozenset({
+    'press', 'presses', 'university', 'verlag', 'edition', 'editions',
+    'pp', 'pages',
+    'hardcover', 'paperback', 'hbk', 'pbk',
+})
+_NON_NAMES = frozenset({'Approaches', 'Alternative', 'Blackwell', 'Thought', 'rapports',
+                        'pages', 'Press', 'Club', 'Allegory', 'Hegel'})
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_review_title(raw_title, subtitle):
+    """parse_review_title(), memoized on the only inputs it reads.
+
+    The fix steps re-parse overlapping DOIs (garbled authors are cleared and
+    then picked up again as missing), so repeats become a dict lookup. The
+    returned dict is shared between callers; don't mutate it.
+    """
+    return parse_review_title(raw_title, subtitle)
 
 
 def is_garbled_author(first: str, last: str) -> bool:
@@ -52,46 +267,101 @@ def is_garbled_author(first: str, last: str) -> bool:
     combined = f'{first} {last}'.strip()
     if not combined:
         return False
-    # ISBN patterns (including old-style 0-xxxx format)
-    if re.search(r'ISBN|978[-\d]|97[89]\d|0-\d{3,}', combined, re.IGNORECASE):
-        return True
-    # Publisher/institution names
-    if re.search(r'\bPress\b|\bUniversity\b|\bPublisher|\bVerlag\b|\bEditions?\b|\bPresses\b', combined, re.IGNORECASE):
-        return True
-    # Page counts
-    if re.search(r'\bpp\.|\bpages\b|\bPp\b', combined, re.IGNORECASE):
-        return True
-    # Prices
-    if re.search(r'[\$£€]\d|dollars?|\bRs\.', combined, re.IGNORECASE):
-        return True
-    # Year patterns in author names (e.g. "2009)" or "2011),")
-    if re.search(r'\b(19|20)\d{2}\)?[,.]?\s*$', last):
-        return True
-    if re.search(r'\b(19|20)\d{2}\)', combined):
-        return True
-    # Publication metadata keywords
-    if re.search(r'\bHardcover\b|\bPaperback\b|\bHbk\b|\bPbk\b', combined, re.IGNORECASE):
-        return True
+    # Cheap string checks first
     # Suspiciously long last name (>25 chars)
     if len(last) > 25:
         return True
-    # Last name contains digits
-    if last and re.search(r'\d', last):
+    # Last name is a common non-name word
+    if last in _NON_NAMES:
         return True
-    # First name contains colons or semicolons (publisher city patterns)
-    if first and re.search(r'[;:]', first):
+    # Last name contains digits (this also covers trailing years like "2011),");
+    # purely alphabetic names, the common case, can't contain any
+    if last and not last.isalpha() and _DIGIT_RE.search(last):
         return True
-    # First name starts with "&amp" (HTML entity)
-    if first and first.startswith('&amp'):
+    if first:
+        # First name contains colons or semicolons (publisher city patterns)
+        if ':' in first or ';' in first:
+            return True
+        # First name starts with "&amp" (HTML entity)
+        if first.startswith('&amp'):
+            return True
+    # ISBN patterns (including old-style 0-xxxx format), prices, "2009)"
+    if _GARBLED_AUTHOR_RE.search(combined):
         return True
-    # Last name is a common non-name word
-    non_names = {'Approaches', 'Alternative', 'Blackwell', 'Thought', 'rapports',
-                 'pages', 'Press', 'Club', 'Allegory', 'Hegel'}
-    if last in non_names:
+    # Publisher/institution names, page counts, binding keywords
+    if combined.isascii():
+        lowered = combined.lower()
+        tokens = _WORD_RE.findall(lowered)
+        if not _GARBLED_WORDS.isdisjoint(tokens):
+            return True
+        if 'publisher' in lowered and any(t.startswith('publisher') for t in tokens):
+            return True
+    # IGNORECASE folds some non-ASCII letters, so keep the regex there
+    elif _GARBLED_WORDS_RE.search(combined):
         return True
     return False
 
 
+# Title-cleaning patterns, applied in order by clean_title()
+
+_HTML_RE = re.compile(r'<[^>]+>')
+# "By Author Name" suffixes (with credentials)
+_BY_AUTHOR_RE = re.compile(
+    r'\.\s+By\s+[A-Z][a-zA-Z.\s,]+(?:M\.A\.|Ph\.D\.|D\.Phil\.|Fellow|Lecturer|Professor|Director).*$')
+# Publisher info after title: ". Publisher, City, Year"
+_PUBLISHER_RE = re.compile(
+    r'\.\s+(?:Franciscan Institute|Cambridge University|Oxford University|Princeton University|Routledge|Macmillan|Blackwell|Springer|Penguin|Harvard|Yale|MIT|Clarendon|Wiley|Palgrave|Rowman|SUNY|Cornell|Stanford|Duke|Indiana University|University of \w+|Fordham|Continuum|Polity|Ashgate|Brill|Kluwer|Sage|Verso|Pluto|Allen & Unwin|Humanities|Wadsworth|Prentice|Heritage|Bellarmin).*$',
+    re.IGNORECASE)
+# Parenthetical publisher info: "(Publisher, Year, Pages)" or "(City: Publisher, Year)"
+_PAREN_PUB_RE = re.compile(r'\s*\([A-Z][a-z]+(?:\s[A-Z][a-z]+)*(?::|,)\s+\d{4}[^)]*\)\s*$')
+# Standalone parenthetical: "(Oxford: Oxford University Press, 2019)"
+_PAREN_PRESS_RE = re.compile(
+    r'\s*\([A-Z][a-z]+(?:\s[A-Za-z]+)*:\s+[A-Z].*?(?:Press|Publishing|Publishers).*?\)\s*$')
+# Entire title is "(City: Publisher, Year)"
+_ALL_PAREN_RE = re.compile(r'^\([A-Z].*(?:Press|Publishing).*\)$')
+_PRICE_RE = re.compile(r'\s*[\$£]\d+[.\d]*\s*$')
+_EURO_RE = re.compile(r'\s*€\s*\d+[,.\d]*\s*$')
+_ISBN_RE = re.compile(r'\s*\(?ISBN[:\s]?[0-9X-]+\)?\s*$', re.IGNORECASE)
+_PP_RE = re.compile(r'\.?\s*Pp\.?\s+[xivlc\d+\s]+\.?\s*$', re.IGNORECASE)
+_PAGES_RE = re.compile(r'\s*,?\s*\d+\s+pages?\s*\.?\s*$', re.IGNORECASE)
+# The lookbehind only lets a numeral run be tried from its first letter: a
+# start inside the run fails exactly when the run's start does, and without it
+# a long run of these letters costs quadratic time.
+_ROMAN_PAGES_RE = re.compile(
+    r'\s*,?\s*(?<![xivlc])[xivlc]+\s*\+?\s*\d+\s*(?:pp?\.?)?\s*$', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\.\s+\d{4}\s*$')
+_CITY_NAMES = (
+    'New York', 'London', 'Cambridge', 'Oxford', 'Princeton', 'Chicago', 'Boston',
+    'Berkeley', 'Dordrecht', 'Leiden', 'The Hague', 'Ithaca', 'Toronto', 'Paris',
+    'Amsterdam', 'Berlin', 'Bloomington', 'Indianapolis', 'Philadelphia', 'Pittsburgh',
+    'Notre Dame', 'Englewood Cliffs', 'West Lafayette', 'St. Bonaventure', 'Albany',
+    'Minneapolis', 'Charlottesville', 'Edinburgh', 'München', 'Munich', 'Frankfurt',
+    'Montréal', 'Sherbrooke', 'Geneva', 'Genève', 'Cardiff', 'New Haven',
+)
+_CITY_RE = re.compile(
+    r'[,.]?\s+(?:' + '|'.join(re.escape(c) for c in _CITY_NAMES) + r')[,:\s].*$',
+    re.IGNORECASE)
+_RS_RE = re.compile(r'\s*Rs\.\s*\d+.*$')
+_TRAILING_PATTERNS = (
+    _PRICE_RE, _EURO_RE, _ISBN_RE, _PP_RE, _PAGES_RE, _ROMAN_PAGES_RE,
+    _YEAR_RE, _CITY_RE, _RS_RE,
+)
+# The trailing patterns fused into one alternation (flags scoped per branch).
+# If no branch matches, no sub in the ordered chain can fire (whitespace
+# stripping never creates a match), so one search lets clean titles skip it.
+_TRAILING_ANY_RE = re.compile('|'.join(
+    f'(?i:{p.pattern})' if p.flags & re.IGNORECASE else f'(?:{p.pattern})'
+    for p in _TRAILING_PATTERNS
+))
+
+
+# Cheap fast path: an ASCII title containing none of these characters or
+# (lower-cased) substrings can't match any pattern above. Non-ASCII titles
+# always take the regex path, since IGNORECASE folds some non-ASCII letters.
+_TRIGGER_CHARS = frozenset('<.($0123456789')
+_TRIGGER_WORDS = ('isbn', 'pp') + tuple(c.lower() for c in _CITY_NAMES if c.isascii())
+
+
 def clean_title(title):
     """Strip bibliographic metadata from a book title."""
     if not title:
@@ -99,46 +369,56 @@ def clean_title(title):
 
     original = title
 
+    if title.isascii() and _TRIGGER_CHARS.isdisjoint(title):
+        lowered = title.lower()
+        if not any(w in lowered for w in _TRIGGER_WORDS):
+            title = title.strip().rstrip('.,;: ')
+            return title if len(title) >= 3 else original
+
+    # Subs whose pattern starts with \s* take the whitespace before their match
+    # with them, so they leave an already-stripped title stripped. Only those
+    # that can leave whitespace behind (HTML, ". By", ". Publisher", "Pp",
+    # ". 1977", city) are followed by strip(); .*$ and _CITY_RE's [,:\s]
+    # would otherwise see it.
+
     # Strip HTML tags
-    title = re.sub(r'<[^>]+>', '', title).strip()
+    title = _HTML_RE.sub('', title).strip()
 
     # Strip "By Author Name" suffixes (with credentials)
-    title = re.sub(
-        r'\.\s+By\s+[A-Z][a-zA-Z.\s,]+(?:M\.A\.|Ph\.D\.|D\.Phil\.|Fellow|Lecturer|Professor|Director).*$',
-        '', title
-    ).strip()
+    title = _BY_AUTHOR_RE.sub('', title).strip()
 
     # Strip publisher info after title: ". Publisher, City, Year"
-    title = re.sub(r'\.\s+(?:Franciscan Institute|Cambridge University|Oxford University|Princeton University|Routledge|Macmillan|Blackwell|Springer|Penguin|Harvard|Yale|MIT|Clarendon|Wiley|Palgrave|Rowman|SUNY|Cornell|Stanford|Duke|Indiana University|University of \w+|Fordham|Continuum|Polity|Ashgate|Brill|Kluwer|Sage|Verso|Pluto|Allen & Unwin|Humanities|Wadsworth|Prentice|Heritage|Bellarmin).*$', '', title, flags=re.IGNORECASE).strip()
+    title = _PUBLISHER_RE.sub('', title).strip()
 
     # Strip parenthetical publisher info: "(Publisher, Year, Pages)" or "(City: Publisher, Year)"
-    title = re.sub(r'\s*\([A-Z][a-z]+(?:\s[A-Z][a-z]+)*(?::|,)\s+\d{4}[^)]*\)\s*$', '', title).strip()
+    title = _PAREN_PUB_RE.sub('', title)
     # Standalone parenthetical: "(Oxford: Oxford University Press, 2019)"
-    title = re.sub(r'\s*\([A-Z][a-z]+(?:\s[A-Za-z]+)*:\s+[A-Z].*?(?:Press|Publishing|Publishers).*?\)\s*$', '', title).strip()
+    title = _PAREN_PRESS_RE.sub('', title)
     # Bare parenthetical at start: entire title is "(City: Publisher, Year)"
-    if re.match(r'^\([A-Z].*(?:Press|Publishing).*\)$', title):
+    if _ALL_PAREN_RE.match(title):
         return original  # Don't clean if the entire title would be erased
 
-    # Strip trailing price: "$12.95" / "£44.50" / "€ 18,80"
-    title = re.sub(r'\s*[\$£]\d+[.\d]*\s*$', '', title).strip()
-    title = re.sub(r'\s*€\s*\d+[,.\d]*\s*$', '', title).strip()
+    if _TRAILING_ANY_RE.search(title):
+        # Strip trailing price: "$12.95" / "£44.50" / "€ 18,80"
+        title = _PRICE_RE.sub('', title)
+        title = _EURO_RE.sub('', title)
 
-    # Strip trailing ISBN: "(ISBN xxx)" or "ISBN xxx"
-    title = re.sub(r'\s*\(?ISBN[:\s]?[0-9X-]+\)?\s*$', '', title, flags=re.IGNORECASE).strip()
+        # Strip trailing ISBN: "(ISBN xxx)" or "ISBN xxx"
+        title = _ISBN_RE.sub('', title)
 
-    # Strip trailing page info: "Pp. xxx" / "xxx pages" / "xii + 472"
-    title = re.sub(r'\.?\s*Pp\.?\s+[xivlc\d+\s]+\.?\s*$', '', title, flags=re.IGNORECASE).strip()
-    title = re.sub(r'\s*,?\s*\d+\s+pages?\s*\.?\s*$', '', title, flags=re.IGNORECASE).strip()
-    title = re.sub(r'\s*,?\s*[xivlc]+\s*\+?\s*\d+\s*(?:pp?\.?)?\s*$', '', title, flags=re.IGNORECASE).strip()
+        # Strip trailing page info: "Pp. xxx" / "xxx pages" / "xii + 472"
+        title = _PP_RE.sub('', title).strip()
+        title = _PAGES_RE.sub('', title)
+        title = _ROMAN_PAGES_RE.sub('', title)
 
-    # Strip trailing year after period: ". 1977"
-    title = re.sub(r'\.\s+\d{4}\s*$', '', title).strip()
+        # Strip trailing year after period: ". 1977"
+        title = _YEAR_RE.sub('', title).strip()
 
-    # Strip trailing city/publisher fragments: ", New York" / ". London:"
-    title = re.sub(r'[,.]?\s+(?:New York|London|Cambridge|Oxford|Princeton|Chicago|Boston|Berkeley|Dordrecht|Leiden|The Hague|Ithaca|Toronto|Paris|Amsterdam|Berlin|Bloomington|Indianapolis|Philadelphia|Pittsburgh|Notre Dame|Englewood Cliffs|West Lafayette|St\. Bonaventure|Albany|Minneapolis|Charlottesville|Edinburgh|München|Munich|Frankfurt|Montréal|Sherbrooke|Geneva|Genève|Cardiff|New Haven)[,:\s].*$', '', title, flags=re.IGNORECASE).strip()
+        # Strip trailing city/publisher fragments: ", New York" / ". London:"
+        title = _CITY_RE.sub('', title).strip()
 
-    # Strip "Rs. 150 ($30)" style price info
-    title = re.sub(r'\s*Rs\.\s*\d+.*$', '', title).strip()
+        # Strip "Rs. 150 ($30)" style price info
+        title = _RS_RE.sub('', title)
 
     # Clean trailing punctuation
     title = title.rstrip('.,;: ')
@@ -150,9 +430,20 @@ def clean_title(title):
     return title
 
 
-def update_entry(entry_id, book_title=None, first=None, last=None):
-    """Update a review entry by ID."""
-    conn = sqlite3.connect(DB_PATH)
+def clean_titles(titles):
+    """clean_title() over a list of titles, in order.
+
+    Cleaning is pure-Python regex work, so large batches go to a process pool
+    (the parent still does all the writes); small ones aren't worth the startup.
+    """
+    if len(titles) < CLEAN_POOL_MIN:
+        return [clean_title(t) for t in titles]
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(clean_title, titles, chunksize=256))
+
+
+def update_entry(conn, entry_id, book_title=None, first=None, last=None):
+    """Update a review entry by ID. Does not commit; see get_conn()."""
     if book_title is not None and first is not None:
         conn.execute(
             "UPDATE reviews SET book_title = ?, book_author_first_name = ?, "
@@ -170,75 +461,98 @@ def update_entry(entry_id, book_title=None, first=None, last=None):
             "book_author_last_name = ? WHERE id = ?",
             (first, last, entry_id)
         )
-    conn.commit()
-    conn.close()
+
+
+# SQL prefilter for ISBNs, publishers, page counts, prices, and suspiciously
+# long last names; is_garbled_author() confirms each candidate (e.g. '%pp%'
+# alone would also match "Lippmann"). Needs the SQL function registered in
+# fix_garbled_authors().
+_GARBLED_CANDIDATE_SQL = (
+    "book_author_last_name != '' AND book_author_last_name IS NOT NULL "
+    "AND (book_author_last_name LIKE '%ISBN%' "
+    "  OR book_author_last_name LIKE '%Press%' "
+    "  OR book_author_last_name LIKE '%University%' "
+    "  OR book_author_last_name LIKE '%Publisher%' "
+    "  OR book_author_last_name LIKE '%Verlag%' "
+    "  OR book_author_last_name LIKE '%pp%' "
+    "  OR book_author_last_name LIKE '%pages%' "
+    "  OR book_author_last_name LIKE '%978-%' "
+    "  OR book_author_last_name LIKE '%0-%' "
+    "  OR book_author_last_name LIKE '%Hardcover%' "
+    "  OR book_author_last_name LIKE '%Paperback%' "
+    "  OR book_author_last_name GLOB '*[0-9][0-9][0-9]*' "
+    "  OR LENGTH(book_author_last_name) > 30) "
+    "AND is_garbled_author(book_author_first_name, book_author_last_name)"
+)
+
+
+def clear_authors(conn, ids):
+    """Blank the author fields for a list of (id,) tuples. Does not commit."""
+    conn.executemany(
+        "UPDATE reviews SET book_author_first_name = '', book_author_last_name = '' "
+        "WHERE id = ?",
+        ids,
+    )
+    return len(ids)
 
 
 def fix_garbled_authors():
     """Fix entries where author fields contain garbled metadata."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    # Use SQL-based detection for reliability — catches ISBNs, publishers,
-    # page counts, prices, and suspiciously long last names
-    rows = conn.execute(
+    conn = get_conn()
+    # is_garbled_author() confirms each SQL candidate, inside SQLite, so the
+    # DOI partition and the no-DOI clear can happen there too
+    conn.create_function(
+        'is_garbled_author', 2,
+        lambda first, last: is_garbled_author(first or '', last), deterministic=True)
+
+    # Clear garbled authors without DOIs: nothing to re-fetch them from
+    cleared = conn.execute(
+        "UPDATE reviews SET book_author_first_name = '', book_author_last_name = '' "
+        f"WHERE {_NO_DOI_SQL} AND {_GARBLED_CANDIDATE_SQL}"
+    ).rowcount
+
+    with_doi = conn.execute(
         "SELECT id, doi, book_title, book_author_first_name, book_author_last_name, "
-        "publication_source FROM reviews "
-        "WHERE book_author_last_name != '' AND book_author_last_name IS NOT NULL "
-        "AND (book_author_last_name LIKE '%ISBN%' "
-        "  OR book_author_last_name LIKE '%Press%' "
-        "  OR book_author_last_name LIKE '%University%' "
-        "  OR book_author_last_name LIKE '%Publisher%' "
-        "  OR book_author_last_name LIKE '%Verlag%' "
-        "  OR book_author_last_name LIKE '%pp%' "
-        "  OR book_author_last_name LIKE '%pages%' "
-        "  OR book_author_last_name LIKE '%978-%' "
-        "  OR book_author_last_name LIKE '%0-%' "
-        "  OR book_author_last_name LIKE '%Hardcover%' "
-        "  OR book_author_last_name LIKE '%Paperback%' "
-        "  OR LENGTH(book_author_last_name) > 30)"
+        "publication_source, publication_date FROM reviews "
+        f"WHERE {_HAS_DOI_SQL} AND {_GARBLED_CANDIDATE_SQL}"
     ).fetchall()
-    conn.close()
-
-    garbled = [dict(r) for r in rows]
-    print(f'Found {len(garbled)} entries with garbled author names')
+    print(f'Found {len(with_doi) + cleared} entries with garbled author names')
+    print(f'  With DOI (can re-fetch): {len(with_doi)}')
+    print(f'  Without DOI: {cleared}')
 
     fixed = 0
-    cleared = 0
     failed = 0
+    to_clear = []  # ids whose garbled author gets blanked at the next commit
 
-    with_doi = [e for e in garbled if e['doi']]
-    without_doi = [e for e in garbled if not e['doi']]
-    print(f'  With DOI (can re-fetch): {len(with_doi)}')
-    print(f'  Without DOI: {len(without_doi)}')
-
-    # Try re-fetching entries with DOIs
+    # Try re-fetching entries with DOIs, one Crossref request per batch
     for i, entry in enumerate(with_doi):
-        raw_title, subtitle, crossref_data = fetch_crossref_title(entry['doi'])
+        if i % CROSSREF_BATCH == 0:
+            fetched = fetch_crossref_titles_bulk(
+                [e['doi'] for e in with_doi[i:i + CROSSREF_BATCH]])
+        raw_title, subtitle, crossref_data = fetched.get(entry['doi'], (None, None, None))
         if raw_title:
-            result = parse_review_title(raw_title, subtitle or '', crossref_data)
+            result = _parse_review_title(raw_title, subtitle or '')
             if result and result.get('book_author_last') and not is_garbled_author(
                     result.get('book_author_first', ''), result['book_author_last']):
                 clean_book_title = clean_title(result['book_title'])
-                update_entry(entry['id'], book_title=clean_book_title,
+                update_entry(conn, entry['id'], book_title=clean_book_title,
                              first=result['book_author_first'], last=result['book_author_last'])
                 fixed += 1
             else:
                 # Re-parse failed — clear the garbled author
-                update_entry(entry['id'], first='', last='')
-                cleared += 1
+                to_clear.append((entry['id'],))
         else:
-            update_entry(entry['id'], first='', last='')
-            cleared += 1
+            to_clear.append((entry['id'],))
 
-        if (i + 1) % 10 == 0:
-            time.sleep(1)
         if (i + 1) % 100 == 0:
+            # Commit per batch so a crash mid-sweep only loses the last one
+            cleared += clear_authors(conn, to_clear)
+            to_clear = []
+            conn.commit()
             print(f'  Processed {i + 1}/{len(with_doi)}: {fixed} fixed, {cleared} cleared')
 
-    # Clear garbled authors without DOIs
-    for entry in without_doi:
-        update_entry(entry['id'], first='', last='')
-        cleared += 1
+    cleared += clear_authors(conn, to_clear)
+    conn.commit()
 
     print(f'\nGarbled author fix results:')
     print(f'  Fixed with correct author: {fixed}')
@@ -246,6 +560,9 @@ def fix_garbled_authors():
     return fixed, cleared
 
 
+_ENTITY_RE = re.compile(r'&[a-z]+;')
+
+
 def lookup_open_library(title, review_year=None):
     """Look up a book's author via Open Library search API.
 
@@ -255,15 +572,16 @@ def lookup_open_library(title, review_year=None):
         return None, None
 
     # Clean the title for search
-    search_title = re.sub(r'<[^>]+>', '', title)  # Strip HTML
-    search_title = re.sub(r'&amp;', '&', search_title)
-    search_title = re.sub(r'&[a-z]+;', '', search_title)
+    search_title = _HTML_RE.sub('', title)  # Strip HTML
+    search_title = search_title.replace('&amp;', '&')
+    search_title = _ENTITY_RE.sub('', search_title)
     search_title = search_title.strip()
 
     if len(search_title) < 5:
         return None, None
 
     try:
+        OPEN_LIBRARY_LIMIT.wait()
         resp = SESSION.get('https://openlibrary.org/search.json', params={
             'title': search_title,
             'limit': 5,
@@ -272,7 +590,7 @@ def lookup_open_library(title, review_year=None):
         if resp.status_code != 200:
             return None, None
 
-        docs = resp.json().get('docs', [])
+        docs = orjson.loads(resp.content).get('docs', [])
         if not docs:
             return None, None
 
@@ -340,11 +658,12 @@ def lookup_open_library(title, review_year=None):
 
 def fix_missing_authors_open_library():
     """Fix missing authors by looking up book titles in Open Library."""
-    entries = get_missing_author_entries()
     # Filter to entries with reasonable titles
-    eligible = [e for e in entries if e['book_title'] and len(e['book_title']) > 5]
+    eligible = [e for e in get_missing_author_entries()
+                if e['book_title'] and len(e['book_title']) > 5]
     print(f'Found {len(eligible)} entries eligible for Open Library lookup')
 
+    conn = get_conn()
     fixed = 0
     failed = 0
     by_journal = {}
@@ -352,17 +671,11 @@ def fix_missing_authors_open_library():
     for i, entry in enumerate(eligible):
         title = entry['book_title']
         # Extract year from publication_date if available
-        review_year = None
-        conn = sqlite3.connect(DB_PATH)
-        row = conn.execute("SELECT publication_date FROM reviews WHERE id = ?",
-                          (entry['id'],)).fetchone()
-        conn.close()
-        if row and row[0]:
-            review_year = row[0][:4]
+        review_year = entry['publication_date'][:4] if entry['publication_date'] else None
 
         first, last = lookup_open_library(title, review_year)
         if first is not None and last:
-            update_entry(entry['id'], first=first, last=last)
+            update_entry(conn, entry['id'], first=first, last=last)
             fixed += 1
             journal = entry['publication_source']
             by_journal[journal] = by_journal.get(journal, 0) + 1
@@ -371,12 +684,10 @@ def fix_missing_authors_open_library():
         else:
             failed += 1
 
-        # Rate limiting: ~2/sec for Open Library
-        if (i + 1) % 2 == 0:
-            time.sleep(0.5)
-
         if (i + 1) % 100 == 0:
+            conn.commit()
             print(f'  Processed {i + 1}/{len(eligible)}: {fixed} fixed, {failed} failed')
+    conn.commit()
 
     print(f'\nOpen Library lookup results:')
     print(f'  Fixed: {fixed}')
@@ -391,29 +702,34 @@ def fix_missing_authors_open_library():
 
 def fix_missing_authors():
     """Re-fetch and re-parse entries with missing authors."""
-    entries = get_missing_author_entries()
-    print(f'Found {len(entries)} entries with missing authors')
-
-    with_doi = [e for e in entries if e['doi']]
-    without_doi = [e for e in entries if not e['doi']]
+    conn = get_conn()
+    with_doi = list(get_missing_author_entries(with_doi=True))
+    (without_doi,) = conn.execute(
+        f"SELECT COUNT(*) FROM reviews WHERE {_MISSING_AUTHOR_SQL} AND {_NO_DOI_SQL}"
+    ).fetchone()
+    print(f'Found {len(with_doi) + without_doi} entries with missing authors')
     print(f'  With DOI (can re-fetch): {len(with_doi)}')
-    print(f'  Without DOI (cannot re-fetch): {len(without_doi)}')
+    print(f'  Without DOI (cannot re-fetch): {without_doi}')
 
     fixed = 0
     failed = 0
     by_journal = {}
 
     for i, entry in enumerate(with_doi):
-        raw_title, subtitle, crossref_data = fetch_crossref_title(entry['doi'])
+        if i % CROSSREF_BATCH == 0:
+            fetched = fetch_crossref_titles_bulk(
+                [e['doi'] for e in with_doi[i:i + CROSSREF_BATCH]])
+        raw_title, subtitle, crossref_data = fetched.get(entry['doi'], (None, None, None))
         if not raw_title:
             failed += 1
             continue
 
-        result = parse_review_title(raw_title, subtitle or '', crossref_data)
+        result = _parse_review_title(raw_title, subtitle or '')
         if result and result.get('book_author_last'):
             # Clean the title too
             clean_book_title = clean_title(result['book_title'])
             update_entry(
+                conn,
                 entry['id'],
                 book_title=clean_book_title,
                 first=result['book_author_first'],
@@ -425,16 +741,14 @@ def fix_missing_authors():
         else:
             failed += 1
 
-        # Rate limiting: ~10/sec
-        if (i + 1) % 10 == 0:
-            time.sleep(1)
-
         if (i + 1) % 100 == 0:
+            conn.commit()
             print(f'  Processed {i + 1}/{len(with_doi)}: {fixed} fixed, {failed} failed')
+    conn.commit()
 
     print(f'\nAuthor fix results:')
     print(f'  Fixed: {fixed}')
-    print(f'  Still missing: {failed + len(without_doi)}')
+    print(f'  Still missing: {failed + without_doi}')
     print(f'  By journal:')
     for journal, count in sorted(by_journal.items(), key=lambda x: -x[1]):
         print(f'    {journal}: {count}')
@@ -444,57 +758,59 @@ def fix_missing_authors():
 
 def fix_long_titles():
     """Clean bibliographic metadata from overly long titles."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = get_conn()
     rows = conn.execute(
         "SELECT id, book_title, publication_source FROM reviews "
         "WHERE LENGTH(book_title) > 150"
     ).fetchall()
-    conn.close()
 
     print(f'\nFound {len(rows)} titles longer than 150 chars')
 
-    fixed = 0
-    for row in rows:
-        row = dict(row)
-        cleaned = clean_title(row['book_title'])
+    updates = []
+    for row, cleaned in zip(rows, clean_titles([r['book_title'] for r in rows])):
         if cleaned != row['book_title'] and len(cleaned) < len(row['book_title']):
             print(f'  [{row["publication_source"]}]')
             print(f'    Before: {row["book_title"][:100]}...')
             print(f'    After:  {cleaned[:100]}')
-            update_entry(row['id'], book_title=cleaned)
-            fixed += 1
+            updates.append((cleaned, row['id']))
+    conn.executemany("UPDATE reviews SET book_title = ? WHERE id = ?", updates)
+    conn.commit()
+    fixed = len(updates)
 
     print(f'Cleaned {fixed} long titles')
     return fixed
 
 
-def fix_all_titles_with_metadata():
-    """Clean bibliographic metadata from ALL titles, not just long ones."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    # Look for titles with common bibliographic patterns
-    rows = conn.execute(
-        "SELECT id, book_title FROM reviews "
-        "WHERE book_title LIKE '%Pp.%' "
-        "   OR book_title LIKE '%pages%' "
-        "   OR book_title LIKE '%ISBN%' "
-        "   OR book_title LIKE '%$%' "
-        "   OR book_title LIKE '%£%' "
-        "   OR book_title LIKE '%. By %M.A.%' "
-        "   OR book_title LIKE '%. By %Ph.D.%'"
-    ).fetchall()
-    conn.close()
+# Titles with common bibliographic patterns
+_TITLE_METADATA_SQL = (
+    "(book_title LIKE '%Pp.%' "
+    "   OR book_title LIKE '%pages%' "
+    "   OR book_title LIKE '%ISBN%' "
+    "   OR book_title LIKE '%$%' "
+    "   OR book_title LIKE '%£%' "
+    "   OR book_title LIKE '%. By %M.A.%' "
+    "   OR book_title LIKE '%. By %Ph.D.%')"
+)
 
-    print(f'\nFound {len(rows)} titles with potential bibliographic metadata')
 
-    fixed = 0
-    for row in rows:
-        row = dict(row)
-        cleaned = clean_title(row['book_title'])
-        if cleaned != row['book_title']:
-            update_entry(row['id'], book_title=cleaned)
-            fixed += 1
+def fix_all_titles_with_metadata():
+    """Clean bibliographic metadata from ALL titles, not just long ones."""
+    conn = get_conn()
+    found = conn.execute(
+        f"SELECT COUNT(*) FROM reviews WHERE {_TITLE_METADATA_SQL}").fetchone()[0]
+
+    print(f'\nFound {found} titles with potential bibliographic metadata')
+
+    # Clean inside one UPDATE instead of fetching every candidate and writing
+    # the changed ones back. The WHERE and SET calls for a row come back to
+    # back, so a one-entry cache means each title is only cleaned once.
+    conn.create_function(
+        'clean_title', 1, functools.lru_cache(maxsize=1)(clean_title), deterministic=True)
+    fixed = conn.execute(
+        "UPDATE reviews SET book_title = clean_title(book_title) "
+        f"WHERE {_TITLE_METADATA_SQL} AND clean_title(book_title) != book_title"
+    ).rowcount
+    conn.commit()
 
     print(f'Cleaned {fixed} titles with bibliographic metadata')
     return fixed
@@ -507,17 +823,17 @@ def remove_false_positive_reviews():
     created when parse_review_title() split a research article title at
     a comma, colon, or hyphen.
 
-    For each suspect entry, re-fetch from Crossref and re-check with
-    strict is_book_review(detection_mode='italic_only'). If it no longer
+    For each suspect entry, re-fetch from Crossref (in bulk batches; only the
+    title is needed) and re-check with strict
+    is_book_review(detection_mode='italic_only'). If it no longer
     qualifies as a book review, delete it. If it IS a legitimate review,
     re-parse to fix the author.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = get_conn()
 
     # Find suspect entries: empty first name + non-empty last name (title fragment as "author")
     # OR first name contains articles/prepositions (another title-fragment pattern)
-    rows = conn.execute("""
+    suspects = conn.execute("""
         SELECT id, doi, book_title, book_author_first_name, book_author_last_name,
                publication_source, review_link
         FROM reviews
@@ -540,9 +856,6 @@ def remove_false_positive_reviews():
             (book_author_last_name LIKE '% % %')
         )
     """).fetchall()
-    conn.close()
-
-    suspects = [dict(r) for r in rows]
     print(f'Found {len(suspects)} suspect entries (potential false positives)')
 
     deleted = 0
@@ -550,37 +863,33 @@ def remove_false_positive_reviews():
     kept = 0
     errors = 0
     by_journal_deleted = {}
+    to_reparse = []  # (book_title, first, last, id), written after the loop
+    to_delete = []  # (id,)
 
     for i, entry in enumerate(suspects):
-        doi = entry['doi']
+        if i % CROSSREF_BATCH == 0:
+            fetched = fetch_crossref_titles_bulk(
+                [e['doi'] for e in suspects[i:i + CROSSREF_BATCH]])
+        if entry['doi'] not in fetched:
+            errors += 1
+            continue
+        raw_title, subtitle, crossref_data = fetched[entry['doi']]
         try:
-            resp = SESSION.get(f'https://api.crossref.org/works/{doi}', timeout=15)
-            if resp.status_code != 200:
-                errors += 1
-                continue
-
-            crossref_data = resp.json()['message']
-
             # Re-check with strict mode (no name-based heuristics)
             if is_book_review(crossref_data, detection_mode='italic_only'):
                 # Legitimate book review — re-parse to fix the author
-                raw_title = (crossref_data.get('title', ['']) or [''])[0]
-                subtitle = (crossref_data.get('subtitle', ['']) or [''])[0] if crossref_data.get('subtitle') else ''
-                result = parse_review_title(raw_title, subtitle, crossref_data)
+                result = _parse_review_title(raw_title, subtitle)
                 if result and result.get('book_title'):
                     clean_book = clean_title(result['book_title'])
                     first = result.get('book_author_first', '')
                     last = result.get('book_author_last', '')
-                    update_entry(entry['id'], book_title=clean_book, first=first, last=last)
+                    to_reparse.append((clean_book, first, last, entry['id']))
                     reparsed += 1
                 else:
                     kept += 1
             else:
                 # NOT a book review — delete it
-                conn = sqlite3.connect(DB_PATH)
-                conn.execute("DELETE FROM reviews WHERE id = ?", (entry['id'],))
-                conn.commit()
-                conn.close()
+                to_delete.append((entry['id'],))
                 deleted += 1
                 journal = entry['publication_source']
                 by_journal_deleted[journal] = by_journal_deleted.get(journal, 0) + 1
@@ -588,13 +897,17 @@ def remove_false_positive_reviews():
         except Exception as e:
             errors += 1
 
-        # Rate limiting
-        if (i + 1) % 10 == 0:
-            time.sleep(1)
-
         if (i + 1) % 200 == 0:
             print(f'  Processed {i + 1}/{len(suspects)}: {deleted} deleted, {reparsed} re-parsed, {errors} errors')
 
+    conn.executemany(
+        "UPDATE reviews SET book_title = ?, book_author_first_name = ?, "
+        "book_author_last_name = ? WHERE id = ?",
+        to_reparse,
+    )
+    conn.executemany("DELETE FROM reviews WHERE id = ?", to_delete)
+    conn.commit()
+
     print(f'\nFalse positive removal results:')
     print(f'  Deleted (not book reviews): {deleted}')
     print(f'  Re-parsed (fixed author): {reparsed}')
@@ -609,52 +922,61 @@ def remove_false_positive_reviews():
 
 
 def main():
-    print('=== PhilReviews Data Quality Sweep Round 2 ===\n')
+    global _refresh_cache
+    parser = argparse.ArgumentParser(description='PhilReviews data quality sweep')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-fetch every DOI from Crossref instead of using crossref_cache')
+    args = parser.parse_args()
+    _refresh_cache = args.refresh
 
-    # Check baseline
-    conn = sqlite3.connect(DB_PATH)
-    missing_before = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE book_author_last_name IS NULL OR book_author_last_name = ''"
-    ).fetchone()[0]
-    long_before = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE LENGTH(book_title) > 200"
-    ).fetchone()[0]
-    garbled_before = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE book_author_last_name != '' "
-        "AND book_author_last_name IS NOT NULL"
-    ).fetchone()[0]  # Will count in fix_garbled_authors
-    conn.close()
-    print(f'Baseline: {missing_before} missing authors, {long_before} titles >200 chars\n')
-
-    # Step 1: Fix garbled authors (ISBNs, publishers in author fields)
-    print('--- Step 1: Fix garbled author names ---')
-    fix_garbled_authors()
-
-    # Step 2: Fix missing authors via Crossref re-fetch
-    print('\n--- Step 2: Fix missing authors via Crossref re-fetch ---')
-    fix_missing_authors()
-
-    # Step 3: Clean long titles
-    print('\n--- Step 3: Clean long titles ---')
-    fix_long_titles()
-
-    # Step 4: Clean bibliographic metadata from all titles
-    print('\n--- Step 4: Clean bibliographic metadata from all titles ---')
-    fix_all_titles_with_metadata()
-
-    # Final check
-    conn = sqlite3.connect(DB_PATH)
-    missing_after = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE book_author_last_name IS NULL OR book_author_last_name = ''"
-    ).fetchone()[0]
-    long_after = conn.execute(
-        "SELECT COUNT(*) FROM reviews WHERE LENGTH(book_title) > 200"
-    ).fetchone()[0]
-    conn.close()
-
-    print(f'\n=== Summary ===')
-    print(f'Missing authors: {missing_before} → {missing_after} ({"+" if missing_after > missing_before else ""}{missing_after - missing_before})')
-    print(f'Long titles (>200): {long_before} → {long_after} (fixed {long_before - long_after})')
+    print('=== PhilReviews Data Quality Sweep Round 2 ===\n')
+    conn = get_conn()
+    _ensure_indexes(conn)
+    try:
+        # Check baseline
+        missing_before = conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE book_author_last_name IS NULL OR book_author_last_name = ''"
+        ).fetchone()[0]
+        long_before = conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE LENGTH(book_title) > 200"
+        ).fetchone()[0]
+        garbled_before = conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE book_author_last_name != '' "
+            "AND book_author_last_name IS NOT NULL"
+        ).fetchone()[0]  # Will count in fix_garbled_authors
+        print(f'Baseline: {missing_before} missing authors, {long_before} titles >200 chars\n')
+
+        # Step 1: Fix garbled authors (ISBNs, publishers in author fields)
+        print('--- Step 1: Fix garbled author names ---')
+        fix_garbled_authors()
+
+        # Step 2: Fix missing authors via Crossref re-fetch
+        print('\n--- Step 2: Fix missing authors via Crossref re-fetch ---')
+        fix_missing_authors()
+
+        # Step 3: Clean long titles
+        print('\n--- Step 3: Clean long titles ---')
+        fix_long_titles()
+
+        # Step 4: Clean bibliographic metadata from all titles
+        print('\n--- Step 4: Clean bibliographic metadata from all titles ---')
+        fix_all_titles_with_metadata()
+
+        # Final check
+        missing_after = conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE book_author_last_name IS NULL OR book_author_last_name = ''"
+        ).fetchone()[0]
+        long_after = conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE LENGTH(book_title) > 200"
+        ).fetchone()[0]
+
+        print(f'\n=== Summary ===')
+        print(f'Missing authors: {missing_before} → {missing_after} ({"+" if missing_after > missing_before else ""}{missing_after - missing_before})')
+        print(f'Long titles (>200): {long_before} → {long_after} (fixed {long_before - long_after})')
+    finally:
+        # Discard a failed step's uncommitted work before the drop commits
+        conn.rollback()
+        _drop_indexes(conn)
 
 
 if __name__ == '__main__':
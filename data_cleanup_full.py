@@ -10,25 +10,34 @@ Usage:
     python3 data_cleanup_full.py --dry-run        # preview only
     python3 data_cleanup_full.py --phase 1-6      # offline only
     python3 data_cleanup_full.py --phase 7-8      # Crossref enrichment only
+    python3 data_cleanup_full.py --no-cache       # ignore crossref_cache.db
 """
 
 import argparse
 import html
+import itertools
 import re
 import sqlite3
-import sys
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 import requests
 
+from crossref_scraper import parse_review_title, _looks_like_author_name
+from rate_limit import RateLimiter
+
 DB_PATH = Path(__file__).parent / 'reviews.db'
+CACHE_PATH = Path(__file__).parent / 'crossref_cache.db'
 
 # ---------------------------------------------------------------------------
 # Phase 1: Non-review patterns to delete
 # ---------------------------------------------------------------------------
-NON_REVIEW_SQL = """
-    SELECT id, book_title, publication_source FROM reviews WHERE
+NON_REVIEW_WHERE = """
     LOWER(book_title) LIKE '%list of members%'
     OR LOWER(book_title) LIKE '%descriptive notices%'
     OR (LOWER(book_title) LIKE 'booknotes%' AND publication_source = 'Philosophy')
@@ -58,12 +67,16 @@ NON_REVIEW_SQL = """
 # ---------------------------------------------------------------------------
 # Phase 2: Irrecoverable placeholder patterns
 # ---------------------------------------------------------------------------
-PLACEHOLDER_SQL = """
-    SELECT id, book_title, publication_source FROM reviews WHERE
+PLACEHOLDER_WHERE = """
     LOWER(book_title) IN ('book review', 'book reviews', 'reviews', 'review', 'book notes')
     AND (book_author_last_name IS NULL OR book_author_last_name = '')
 """
 
+# ---------------------------------------------------------------------------
+# Phase 3: HTML entities to decode
+# ---------------------------------------------------------------------------
+ENTITY_RE = re.compile(r'&(?:#|amp;|quot;|lt;|gt;)', re.IGNORECASE)
+
 # ---------------------------------------------------------------------------
 # Phase 4: Journal name normalization mapping (wrong → correct)
 # ---------------------------------------------------------------------------
@@ -83,28 +96,263 @@ JOURNAL_FIXES = {
 }
 
 # ---------------------------------------------------------------------------
-# Phase 5: "Book Review:" prefix regex
+# Phase 5: "Book Review:" prefixes, lowercase (matched against LOWER(book_title))
 # ---------------------------------------------------------------------------
-BOOK_REVIEW_PREFIX_RE = re.compile(
-    r'^(?:BOOK\s+REVIEW|Book\s+[Rr]eview)\s*[-:]\s*', re.IGNORECASE
-)
+BOOK_REVIEW_PREFIXES = ('book review:', 'book review -')
+
+# ---------------------------------------------------------------------------
+# Phases 7-8: Crossref lookups
+# ---------------------------------------------------------------------------
+# Rows phases 7 and 8 look up; the partial indexes in CLEANUP_INDEXES use the same predicates
+MISSING_AUTHOR_WHERE = """(book_author_last_name IS NULL OR book_author_last_name = '')
+        AND doi IS NOT NULL AND doi != ''"""
+MISSING_REVIEWER_WHERE = """(reviewer_last_name IS NULL OR reviewer_last_name = '')
+        AND doi IS NOT NULL AND doi != ''"""
+
+# Temporary indexes for the phase lookups; name -> (phases that use it, definition).
+# Built only for real runs that include those phases, and dropped at the end
+CLEANUP_INDEXES = {
+    # Title lookups go through LOWER(book_title) so they can use this index
+    'idx_lower_title': ((2, 5, 6), 'reviews(LOWER(book_title))'),
+    'idx_pubsrc': ((4,), 'reviews(publication_source)'),
+    'idx_missing_author_doi': ((7,), f'reviews(id) WHERE {MISSING_AUTHOR_WHERE}'),
+    'idx_missing_reviewer_doi': ((8,), f'reviews(id) WHERE {MISSING_REVIEWER_WHERE}'),
+}
+
+CROSSREF_WORKS = 'https://api.crossref.org/works'
+CROSSREF_BATCH = 80   # DOIs per filter query
+CROSSREF_SELECT = 'DOI,title,subtitle,author'
+CROSSREF_WORKERS = 12  # concurrent batch fetches
+CROSSREF_RATE = 10     # requests/sec across all threads
+MAX_ERRORS = 20        # give up on Crossref after this many failed lookups
+COMMIT_EVERY = 500     # rows between commits in phases 7-8
+USER_AGENT = 'PhilReviews/1.0 (mailto:mzwolinski@sandiego.edu)'
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def get_conn():
+    """Connection tuned for one long write transaction (main() commits once at the end)."""
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    conn.executescript(
+        'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA cache_size=-200000; '
+        'PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;'
+    )
     return conn
 
 
+def create_cleanup_indexes(conn, phases):
+    """Build the cleanup indexes the given phases use; return their names."""
+    names = [name for name, (used_by, _) in CLEANUP_INDEXES.items() if set(used_by) & set(phases)]
+    for name in names:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {CLEANUP_INDEXES[name][1]}')
+    conn.commit()
+    return names
+
+
+def drop_cleanup_indexes(conn, names):
+    for name in names:
+        conn.execute(f'DROP INDEX IF EXISTS {name}')
+    conn.commit()
+
+
 def phase_header(num, name):
     print(f'\n{"="*60}')
     print(f'Phase {num}: {name}')
     print('='*60)
 
 
+CROSSREF_LIMIT = RateLimiter(CROSSREF_RATE)
+_local = threading.local()
+_cache = None
+_use_cache = True  # --no-cache: ignore responses cached by earlier runs
+_fetched = set()   # DOIs saved during this run, which phase 8 reuses even with --no-cache
+
+
+def get_session():
+    """Per-thread requests.Session, so each worker keeps its own connection pool."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def get_cache():
+    """Sidecar DB of Crossref responses, shared by phases 7 and 8 and across runs."""
+    global _cache
+    if _cache is None:
+        _cache = sqlite3.connect(str(CACHE_PATH))
+        _cache.execute(
+            'CREATE TABLE IF NOT EXISTS crossref (doi TEXT PRIMARY KEY, fetched_at INTEGER, json BLOB)'
+        )
+    return _cache
+
+
+def cache_lookup(dois):
+    """Return {doi.lower(): message} for DOIs already in the cache (None = not in Crossref)."""
+    wanted = {d.lower() for d in dois}
+    if not _use_cache:
+        wanted &= _fetched
+    if not wanted:
+        return {}
+    cache = get_cache()
+    wanted = list(wanted)
+    found = {}
+    # Stay under SQLite's bound-parameter limit
+    for i in range(0, len(wanted), 500):
+        part = wanted[i:i + 500]
+        found.update(
+            (doi, orjson.loads(zlib.decompress(blob)))
+            for doi, blob in cache.execute(
+                f'SELECT doi, json FROM crossref WHERE doi IN ({",".join("?" * len(part))})', part
+            )
+        )
+    return found
+
+
+def cache_store(records):
+    """Save {doi.lower(): message} to the cache."""
+    if not records:
+        return
+    now = int(time.time())
+    cache = get_cache()
+    cache.executemany(
+        'INSERT OR REPLACE INTO crossref (doi, fetched_at, json) VALUES (?, ?, ?)',
+        [(doi, now, zlib.compress(orjson.dumps(data))) for doi, data in records.items()]
+    )
+    cache.commit()
+    _fetched.update(records)
+
+
+def fetch_crossref_batch(dois):
+    """Look up many DOIs with one filter query. Returns {doi.lower(): message}."""
+    # Commas separate filter values, so those DOIs go through fetch_crossref_work
+    dois = [d for d in dois if ',' not in d]
+    if not dois:
+        return {}
+    CROSSREF_LIMIT.wait()
+    resp = get_session().get(CROSSREF_WORKS, params={
+        'filter': ','.join(f'doi:{d}' for d in dois),
+        'rows': len(dois) + 20,
+        'select': CROSSREF_SELECT,
+    }, timeout=30)
+    resp.raise_for_status()
+    return {item['DOI'].lower(): item for item in orjson.loads(resp.content)['message']['items']}
+
+
+def fetch_crossref_work(doi):
+    """Look up a single DOI. Returns None if Crossref has no record of it."""
+    CROSSREF_LIMIT.wait()
+    resp = get_session().get(f'{CROSSREF_WORKS}/{doi}', timeout=15)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    return orjson.loads(resp.content)['message']
+
+
+class CrossrefAborted(Exception):
+    """Raised by iter_crossref when lookups stop after MAX_ERRORS failures."""
+
+
+def fetch_crossref_chunk(chunk, stop, failures):
+    """Return [(row, message)] for a chunk of rows; see iter_crossref.
+
+    Once stop is set the list is cut short, and iter_crossref raises
+    CrossrefAborted when it reaches the gap.
+    """
+    if stop.is_set():
+        return []
+    try:
+        found = fetch_crossref_batch([r['doi'] for r in chunk])
+    except Exception:
+        found = {}
+    results = []
+    for r in chunk:
+        data = found.get(r['doi'].lower())
+        if data is None:
+            if stop.is_set():
+                break
+            try:
+                data = fetch_crossref_work(r['doi'])
+            except Exception as e:
+                data = e
+                if next(failures) >= MAX_ERRORS:
+                    stop.set()
+        results.append((r, data))
+    return results
+
+
+def iter_crossref(rows):
+    """Yield (row, message) for rows with a DOI, in order.
+
+    DOIs in the cache are answered from it; the rest are fetched in chunks of
+    CROSSREF_BATCH rows on CROSSREF_WORKERS threads and saved to the cache.
+    message is None when the DOI isn't in Crossref, or the exception raised
+    when the lookup failed. DOIs missing from a batch response are retried
+    individually so a bad batch never loses rows. After MAX_ERRORS failed
+    lookups the rest are abandoned and CrossrefAborted is raised instead of
+    yielding past them.
+    """
+    cached = cache_lookup([r['doi'] for r in rows])
+    todo = [r for r in rows if r['doi'].lower() not in cached]
+    chunks = [todo[i:i + CROSSREF_BATCH] for i in range(0, len(todo), CROSSREF_BATCH)]
+    stop = threading.Event()
+    failures = itertools.count()
+    fetched = {}
+    pool = ThreadPoolExecutor(max_workers=CROSSREF_WORKERS)
+    try:
+        answers = pool.map(fetch_crossref_chunk, chunks,
+                           [stop] * len(chunks), [failures] * len(chunks))
+        results = iter(())
+        for r in rows:
+            key = r['doi'].lower()
+            if key in cached:
+                yield r, cached[key]
+                continue
+            # Fetched rows come back in order, so r is the next answer, unless
+            # its chunk was cut short after too many errors
+            answer = next(results, None)
+            if answer is None:
+                results = iter(next(answers, ()))
+                answer = next(results, None)
+            if answer is None or answer[0] is not r:
+                raise CrossrefAborted(f'more than {MAX_ERRORS} failed lookups')
+            data = answer[1]
+            if not isinstance(data, Exception):
+                fetched[key] = data
+            yield r, data
+    finally:
+        # Aborted, or the caller stopped early; don't fetch the rest
+        stop.set()
+        pool.shutdown(cancel_futures=True)
+        cache_store(fetched)
+
+
+def crossref_results(rows):
+    """iter_crossref for the phase loops: on CrossrefAborted, report how many
+    rows were never looked up instead of silently ending early."""
+    done = 0
+    try:
+        for item in iter_crossref(rows):
+            yield item
+            done += 1
+    except CrossrefAborted as e:
+        print(f'  Too many errors ({e}), stopping; {len(rows) - done} entries not checked')
+
+
+# Crossref titles repeat across DOIs. parse_review_title doesn't read
+# crossref_data, so its result depends only on the text and can be cached.
+@lru_cache(maxsize=4096)
+def parse_title(title, subtitle):
+    return parse_review_title(title, subtitle)
+
+
+looks_like_author_name = lru_cache(maxsize=2048)(_looks_like_author_name)
+
+
 # ---------------------------------------------------------------------------
 # Phase implementations
 # ---------------------------------------------------------------------------
@@ -112,32 +360,32 @@ def phase_header(num, name):
 def phase1_delete_non_reviews(conn, dry_run):
     """Delete entries that are clearly not book reviews."""
     phase_header(1, 'Delete non-reviews')
-    rows = conn.execute(NON_REVIEW_SQL).fetchall()
+    rows = conn.execute(
+        'SELECT id, book_title, publication_source FROM reviews WHERE ' + NON_REVIEW_WHERE
+    ).fetchall()
     print(f'Found {len(rows)} non-review entries')
     for r in rows:
         print(f'  DELETE id={r["id"]}: "{r["book_title"][:70]}" | {r["publication_source"]}')
     if not dry_run and rows:
-        ids = [r['id'] for r in rows]
-        conn.executemany('DELETE FROM reviews WHERE id = ?', [(i,) for i in ids])
-        conn.commit()
-        print(f'Deleted {len(rows)} entries')
+        deleted = conn.execute('DELETE FROM reviews WHERE ' + NON_REVIEW_WHERE).rowcount
+        print(f'Deleted {deleted} entries')
     return len(rows)
 
 
 def phase2_delete_placeholders(conn, dry_run):
     """Delete placeholder-title entries with no recoverable metadata."""
     phase_header(2, 'Delete irrecoverable placeholders')
-    rows = conn.execute(PLACEHOLDER_SQL).fetchall()
+    rows = conn.execute(
+        'SELECT id, book_title, publication_source FROM reviews WHERE ' + PLACEHOLDER_WHERE + ' ORDER BY id'
+    ).fetchall()
     print(f'Found {len(rows)} placeholder entries')
     for r in rows[:20]:
         print(f'  DELETE id={r["id"]}: "{r["book_title"]}" | {r["publication_source"]}')
     if len(rows) > 20:
         print(f'  ... and {len(rows) - 20} more')
     if not dry_run and rows:
-        ids = [r['id'] for r in rows]
-        conn.executemany('DELETE FROM reviews WHERE id = ?', [(i,) for i in ids])
-        conn.commit()
-        print(f'Deleted {len(rows)} entries')
+        deleted = conn.execute('DELETE FROM reviews WHERE ' + PLACEHOLDER_WHERE).rowcount
+        print(f'Deleted {deleted} entries')
     return len(rows)
 
 
@@ -146,30 +394,45 @@ def phase3_fix_html_entities(conn, dry_run):
     phase_header(3, 'Fix HTML entities')
     fields = ['book_title', 'book_author_first_name', 'book_author_last_name',
               'reviewer_first_name', 'reviewer_last_name']
-    total_fixed = 0
-    for field in fields:
-        rows = conn.execute(
-            f"SELECT id, {field} FROM reviews WHERE {field} LIKE '%&#%' "
-            f"OR {field} LIKE '%&amp;%' OR {field} LIKE '%&quot;%' "
-            f"OR {field} LIKE '%&lt;%' OR {field} LIKE '%&gt;%'"
-        ).fetchall()
-        if not rows:
-            continue
-        print(f'\n  {field}: {len(rows)} entries')
-        updates = []
-        for r in rows:
+    # One scan for all fields; GLOB is a cheap superset of ENTITY_RE
+    concat = ' || '.join(f"COALESCE({f}, '')" for f in fields)
+    rows = conn.execute(
+        f"SELECT id, {', '.join(fields)} FROM reviews WHERE {concat} GLOB '*&[#AaQqLlGg]*'"
+    )
+    matched = {field: [] for field in fields}
+    updates = []
+    unescaped = {}  # names repeat across rows
+    for r in rows:
+        values = [r[field] for field in fields]
+        for j, field in enumerate(fields):
             old_val = r[field]
-            new_val = html.unescape(old_val)
+            # The row matched on some field; most of its others have no '&' at all
+            if not old_val or '&' not in old_val or not ENTITY_RE.search(old_val):
+                continue
+            new_val = unescaped.get(old_val)
+            if new_val is None:
+                new_val = unescaped[old_val] = html.unescape(old_val)
             # Strip trailing comma/period from names
             if 'name' in field:
                 new_val = new_val.rstrip(',. ')
+            matched[field].append((r['id'], old_val, new_val))
+            values[j] = new_val
+        if values != [r[field] for field in fields]:
+            updates.append((*values, r['id']))
+
+    total_fixed = 0
+    for field in fields:
+        if not matched[field]:
+            continue
+        print(f'\n  {field}: {len(matched[field])} entries')
+        for rid, old_val, new_val in matched[field]:
             if old_val != new_val:
-                print(f'    id={r["id"]}: "{old_val}" → "{new_val}"')
-                updates.append((new_val, r['id']))
-        if not dry_run and updates:
-            conn.executemany(f'UPDATE reviews SET {field} = ? WHERE id = ?', updates)
-            conn.commit()
-        total_fixed += len(updates)
+                print(f'    id={rid}: "{old_val}" → "{new_val}"')
+                total_fixed += 1
+    if not dry_run and updates:
+        conn.executemany(
+            f'UPDATE reviews SET {", ".join(f"{f} = ?" for f in fields)} WHERE id = ?', updates
+        )
     print(f'\nTotal HTML entity fixes: {total_fixed}')
     return total_fixed
 
@@ -177,23 +440,26 @@ def phase3_fix_html_entities(conn, dry_run):
 def phase4_normalize_journals(conn, dry_run):
     """Normalize inconsistent journal names."""
     phase_header(4, 'Normalize journal names')
+    wrong_names = list(JOURNAL_FIXES)
+    placeholders = ','.join('?' * len(wrong_names))
+    counts = dict(conn.execute(
+        f'SELECT publication_source, COUNT(*) FROM reviews '
+        f'WHERE publication_source IN ({placeholders}) GROUP BY publication_source',
+        wrong_names
+    ))
     total_fixed = 0
     for wrong, correct in JOURNAL_FIXES.items():
-        rows = conn.execute(
-            'SELECT COUNT(*) as cnt FROM reviews WHERE publication_source = ?',
-            (wrong,)
-        ).fetchone()
-        cnt = rows['cnt']
+        cnt = counts.get(wrong, 0)
         if cnt > 0:
             print(f'  "{wrong}" → "{correct}" ({cnt} entries)')
-            if not dry_run:
-                conn.execute(
-                    'UPDATE reviews SET publication_source = ? WHERE publication_source = ?',
-                    (correct, wrong)
-                )
             total_fixed += cnt
     if not dry_run and total_fixed:
-        conn.commit()
+        cases = ' '.join('WHEN ? THEN ?' for _ in JOURNAL_FIXES)
+        conn.execute(
+            f'UPDATE reviews SET publication_source = CASE publication_source {cases} END '
+            f'WHERE publication_source IN ({placeholders})',
+            [v for pair in JOURNAL_FIXES.items() for v in pair] + wrong_names
+        )
     print(f'Total journal name fixes: {total_fixed}')
     return total_fixed
 
@@ -201,22 +467,24 @@ def phase4_normalize_journals(conn, dry_run):
 def phase5_strip_prefixes(conn, dry_run):
     """Strip 'Book Review:' prefixes from titles."""
     phase_header(5, 'Strip "Book Review:" prefixes')
-    rows = conn.execute("""
-        SELECT id, book_title FROM reviews WHERE
-        book_title LIKE 'Book Review:%' OR book_title LIKE 'BOOK REVIEW:%'
-        OR book_title LIKE 'Book review:%' OR book_title LIKE 'BOOK REVIEW -%'
-        OR book_title LIKE 'Book Review -%'
-    """).fetchall()
+    # Same rows as book_title LIKE 'prefix%' (both ASCII case-insensitive), but
+    # written as LOWER(book_title) ranges so they're idx_lower_title searches
+    rows = conn.execute(
+        'SELECT id, book_title FROM reviews WHERE '
+        + ' OR '.join('(LOWER(book_title) >= ? AND LOWER(book_title) < ?)' for _ in BOOK_REVIEW_PREFIXES)
+        + ' ORDER BY id',
+        [bound for p in BOOK_REVIEW_PREFIXES for bound in (p, p[:-1] + chr(ord(p[-1]) + 1))]
+    )
     updates = []
     for r in rows:
         old = r['book_title']
-        new = BOOK_REVIEW_PREFIX_RE.sub('', old).strip()
+        prefix = next(p for p in BOOK_REVIEW_PREFIXES if old[:len(p)].lower() == p)
+        new = old[len(prefix):].strip()
         if new != old and len(new) > 3:
             print(f'  id={r["id"]}: "{old[:80]}" → "{new[:80]}"')
             updates.append((new, r['id']))
     if not dry_run and updates:
         conn.executemany('UPDATE reviews SET book_title = ? WHERE id = ?', updates)
-        conn.commit()
     print(f'Total prefix strips: {len(updates)}')
     return len(updates)
 
@@ -224,37 +492,43 @@ def phase5_strip_prefixes(conn, dry_run):
 def phase6_fix_corruption(conn, dry_run):
     """Fix known data corruption patterns."""
     phase_header(6, 'Fix known data corruption')
-    total_fixed = 0
+    title_fixes = []     # (book_title, id)
+    reviewer_fixes = []  # (reviewer_first_name, reviewer_last_name, id)
 
     # 6a: "Confusion*1" → "Confusion"
-    rows = conn.execute("SELECT id FROM reviews WHERE book_title = 'Confusion*1'").fetchall()
+    # '+' keeps the planner on idx_lower_title rather than scanning for the exact title
+    rows = conn.execute(
+        "SELECT id FROM reviews WHERE LOWER(book_title) = 'confusion*1' AND +book_title = 'Confusion*1'"
+    ).fetchall()
     if rows:
         print(f'  "Confusion*1" → "Confusion": {len(rows)} entries')
-        if not dry_run:
-            conn.execute("UPDATE reviews SET book_title = 'Confusion' WHERE book_title = 'Confusion*1'")
-        total_fixed += len(rows)
+        title_fixes.extend(('Confusion', r['id']) for r in rows)
 
     # 6b: Malformed reviewer names — strip parenthetical notes
-    paren_fixes = [
-        (11724, 'Kathryn Sophia', 'Belle'),
-        (13320, 'Mark', 'Siderits'),
-        (29937, 'Alex', 'Alraf'),
-    ]
-    for rid, first, last in paren_fixes:
-        row = conn.execute('SELECT reviewer_first_name, reviewer_last_name FROM reviews WHERE id = ?', (rid,)).fetchone()
+    paren_fixes = {
+        11724: ('Kathryn Sophia', 'Belle'),
+        13320: ('Mark', 'Siderits'),
+        29937: ('Alex', 'Alraf'),
+    }
+    current = {
+        r['id']: r for r in conn.execute(
+            f'SELECT id, reviewer_first_name, reviewer_last_name FROM reviews '
+            f'WHERE id IN ({",".join("?" * len(paren_fixes))})', list(paren_fixes)
+        )
+    }
+    for rid, (first, last) in paren_fixes.items():
+        row = current.get(rid)
         if row and (')' in (row['reviewer_last_name'] or '') or ')' in (row['reviewer_first_name'] or '')):
             print(f'  id={rid}: reviewer → "{first} {last}"')
-            if not dry_run:
-                conn.execute(
-                    'UPDATE reviews SET reviewer_first_name = ?, reviewer_last_name = ? WHERE id = ?',
-                    (first, last, rid)
-                )
-            total_fixed += 1
+            reviewer_fixes.append((first, last, rid))
 
     # 6c: Dollar-sign titles in Dialogue (need Crossref to fix properly)
-    dollar_rows = conn.execute("SELECT id, book_title, doi FROM reviews WHERE book_title LIKE '$%'").fetchall()
-    if dollar_rows:
-        print(f'  Dollar-sign titles found: {len(dollar_rows)} (will fix in phase 7 via Crossref)')
+    # book_title LIKE '$%' as an idx_lower_title range ('%' follows '$')
+    dollar_count = conn.execute(
+        "SELECT COUNT(*) FROM reviews WHERE LOWER(book_title) >= '$' AND LOWER(book_title) < '%'"
+    ).fetchone()[0]
+    if dollar_count:
+        print(f'  Dollar-sign titles found: {dollar_count} (will fix in phase 7 via Crossref)')
 
     # 6d: "Apology:" entry in Philosophy that's actually a review
     apology_row = conn.execute(
@@ -263,12 +537,15 @@ def phase6_fix_corruption(conn, dry_run):
     if apology_row and apology_row['book_title'].startswith('Apology:'):
         new_title = apology_row['book_title'].replace('Apology: ', '')
         print(f'  id=57978: strip "Apology: " prefix → "{new_title[:60]}"')
-        if not dry_run:
-            conn.execute('UPDATE reviews SET book_title = ? WHERE id = ?', (new_title, 57978))
-        total_fixed += 1
+        title_fixes.append((new_title, 57978))
 
     if not dry_run:
-        conn.commit()
+        conn.executemany('UPDATE reviews SET book_title = ? WHERE id = ?', title_fixes)
+        conn.executemany(
+            'UPDATE reviews SET reviewer_first_name = ?, reviewer_last_name = ? WHERE id = ?',
+            reviewer_fixes
+        )
+    total_fixed = len(title_fixes) + len(reviewer_fixes)
     print(f'Total corruption fixes: {total_fixed}')
     return total_fixed
 
@@ -277,14 +554,9 @@ def phase7_enrich_authors(conn, dry_run):
     """Use Crossref DOI lookups to recover missing book authors."""
     phase_header(7, 'Crossref enrichment: missing book authors')
 
-    # Import parse_review_title from crossref_scraper
-    sys.path.insert(0, str(Path(__file__).parent))
-    from crossref_scraper import parse_review_title, _extract_first_author, _looks_like_author_name
-
-    rows = conn.execute("""
+    rows = conn.execute(f"""
         SELECT id, book_title, doi, publication_source FROM reviews
-        WHERE (book_author_last_name IS NULL OR book_author_last_name = '')
-        AND doi IS NOT NULL AND doi != ''
+        WHERE {MISSING_AUTHOR_WHERE}
         ORDER BY id
     """).fetchall()
 
@@ -296,30 +568,34 @@ def phase7_enrich_authors(conn, dry_run):
     fixed = 0
     skipped = 0
     errors = 0
-    session = requests.Session()
-    session.headers['User-Agent'] = 'PhilReviews/1.0 (mailto:mzwolinski@sandiego.edu)'
-
-    for i, r in enumerate(rows):
+    author_updates = []  # (first, last, id)
+    titled_updates = []  # (first, last, book_title, id)
+
+    def flush():
+        conn.executemany(
+            'UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ? WHERE id = ?',
+            author_updates
+        )
+        conn.executemany(
+            'UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ?, book_title = ? WHERE id = ?',
+            titled_updates
+        )
+        author_updates.clear()
+        titled_updates.clear()
+
+    for i, (r, data) in enumerate(crossref_results(rows)):
         if (i + 1) % 100 == 0:
             print(f'  Progress: {i+1}/{len(rows)} (fixed: {fixed}, skipped: {skipped})')
+        # Network phases are slow; keep what's been recovered if interrupted
+        if not dry_run and (i + 1) % COMMIT_EVERY == 0:
+            flush()
+            conn.commit()
 
-        doi = r['doi']
-        try:
-            resp = session.get(
-                f'https://api.crossref.org/works/{doi}',
-                timeout=15
-            )
-            if resp.status_code == 404:
-                skipped += 1
-                continue
-            resp.raise_for_status()
-            data = resp.json()['message']
-        except Exception as e:
+        if data is None:
+            skipped += 1
+            continue
+        if isinstance(data, Exception):
             errors += 1
-            if errors > 20:
-                print(f'  Too many errors ({errors}), stopping')
-                break
-            time.sleep(2)
             continue
 
         # Try to extract book author from Crossref metadata
@@ -330,7 +606,7 @@ def phase7_enrich_authors(conn, dry_run):
         if data.get('subtitle'):
             cr_subtitle = data['subtitle'][0]
 
-        parsed = parse_review_title(cr_title, cr_subtitle, crossref_data=data)
+        parsed = parse_title(cr_title, cr_subtitle)
         if parsed and parsed.get('book_author_last') and not parsed.get('needs_doi_scrape'):
             new_first = parsed['book_author_first']
             new_last = parsed['book_author_last']
@@ -340,7 +616,7 @@ def phase7_enrich_authors(conn, dry_run):
             # For enrichment, require first+last (not just a last name) since
             # single-word parses are often misidentified book topics
             full_name = (new_first + ' ' + new_last).strip() if new_first else new_last
-            if not new_first or not _looks_like_author_name(full_name):
+            if not new_first or not looks_like_author_name(full_name):
                 skipped += 1
                 continue
 
@@ -354,30 +630,18 @@ def phase7_enrich_authors(conn, dry_run):
             if dry_run:
                 extra = f', title → "{new_title[:50]}"' if update_title else ''
                 print(f'  id={r["id"]}: → {new_first} {new_last}{extra} | {r["publication_source"]}')
+            elif update_title:
+                titled_updates.append((new_first, new_last, new_title, r['id']))
             else:
-                if update_title:
-                    conn.execute(
-                        'UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ?, book_title = ? WHERE id = ?',
-                        (new_first, new_last, new_title, r['id'])
-                    )
-                else:
-                    conn.execute(
-                        'UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ? WHERE id = ?',
-                        (new_first, new_last, r['id'])
-                    )
+                author_updates.append((new_first, new_last, r['id']))
             fixed += 1
         else:
             # Try reviewer extraction from Crossref author field
             # (reviewer is the author of the review article)
             skipped += 1
 
-        # Rate limit: be polite to Crossref
-        if (i + 1) % 20 == 0:
-            time.sleep(1)
-
     if not dry_run:
-        conn.commit()
-
+        flush()
     print(f'\nResults: {fixed} authors recovered, {skipped} skipped, {errors} errors')
     return fixed
 
@@ -386,10 +650,9 @@ def phase8_enrich_reviewers(conn, dry_run):
     """Use Crossref DOI lookups to recover missing reviewer names."""
     phase_header(8, 'Crossref enrichment: missing reviewers')
 
-    rows = conn.execute("""
+    rows = conn.execute(f"""
         SELECT id, book_title, doi, reviewer_first_name, reviewer_last_name FROM reviews
-        WHERE (reviewer_last_name IS NULL OR reviewer_last_name = '')
-        AND doi IS NOT NULL AND doi != ''
+        WHERE {MISSING_REVIEWER_WHERE}
         ORDER BY id
     """).fetchall()
 
@@ -401,30 +664,28 @@ def phase8_enrich_reviewers(conn, dry_run):
     fixed = 0
     skipped = 0
     errors = 0
-    session = requests.Session()
-    session.headers['User-Agent'] = 'PhilReviews/1.0 (mailto:mzwolinski@sandiego.edu)'
+    updates = []  # (first, last, id)
+
+    def flush():
+        conn.executemany(
+            'UPDATE reviews SET reviewer_first_name = ?, reviewer_last_name = ? WHERE id = ?',
+            updates
+        )
+        updates.clear()
 
-    for i, r in enumerate(rows):
+    for i, (r, data) in enumerate(crossref_results(rows)):
         if (i + 1) % 100 == 0:
             print(f'  Progress: {i+1}/{len(rows)} (fixed: {fixed}, skipped: {skipped})')
+        # Network phases are slow; keep what's been recovered if interrupted
+        if not dry_run and (i + 1) % COMMIT_EVERY == 0:
+            flush()
+            conn.commit()
 
-        doi = r['doi']
-        try:
-            resp = session.get(
-                f'https://api.crossref.org/works/{doi}',
-                timeout=15
-            )
-            if resp.status_code == 404:
-                skipped += 1
-                continue
-            resp.raise_for_status()
-            data = resp.json()['message']
-        except Exception as e:
+        if data is None:
+            skipped += 1
+            continue
+        if isinstance(data, Exception):
             errors += 1
-            if errors > 20:
-                print(f'  Too many errors ({errors}), stopping')
-                break
-            time.sleep(2)
             continue
 
         # Reviewer = the Crossref "author" of the review article
@@ -437,22 +698,15 @@ def phase8_enrich_reviewers(conn, dry_run):
                 if dry_run:
                     print(f'  id={r["id"]}: reviewer → {new_first} {new_last} | "{r["book_title"][:50]}"')
                 else:
-                    conn.execute(
-                        'UPDATE reviews SET reviewer_first_name = ?, reviewer_last_name = ? WHERE id = ?',
-                        (new_first, new_last, r['id'])
-                    )
+                    updates.append((new_first, new_last, r['id']))
                 fixed += 1
             else:
                 skipped += 1
         else:
             skipped += 1
 
-        if (i + 1) % 20 == 0:
-            time.sleep(1)
-
     if not dry_run:
-        conn.commit()
-
+        flush()
     print(f'\nResults: {fixed} reviewers recovered, {skipped} skipped, {errors} errors')
     return fixed
 
@@ -482,10 +736,14 @@ def parse_phase_range(phase_str):
 
 
 def main():
+    global _use_cache
     parser = argparse.ArgumentParser(description='PhilReviews full data cleanup')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes only')
     parser.add_argument('--phase', type=str, default='1-8', help='Phase range to run (e.g. 1-6, 7-8, 3)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Re-fetch every DOI from Crossref instead of using {CACHE_PATH.name}')
     args = parser.parse_args()
+    _use_cache = not args.no_cache
 
     phases_to_run = parse_phase_range(args.phase)
     print(f'PhilReviews Data Cleanup {"(DRY RUN)" if args.dry_run else ""}')
@@ -497,12 +755,22 @@ def main():
     print(f'Total entries before: {total_before:,}')
 
     results = {}
-    for phase_num in phases_to_run:
-        if phase_num not in PHASES:
-            print(f'Unknown phase {phase_num}, skipping')
-            continue
-        name, func = PHASES[phase_num]
-        results[phase_num] = func(conn, args.dry_run)
+    # A dry run only counts, so building the indexes would cost more than it saves
+    indexes = [] if args.dry_run else create_cleanup_indexes(conn, phases_to_run)
+    try:
+        for phase_num in phases_to_run:
+            if phase_num not in PHASES:
+                print(f'Unknown phase {phase_num}, skipping')
+                continue
+            name, func = PHASES[phase_num]
+            results[phase_num] = func(conn, args.dry_run)
+        # Phases don't commit (7-8 only every COMMIT_EVERY rows); one commit covers the run
+        if not args.dry_run:
+            conn.commit()
+    finally:
+        # Discard a failed run's uncommitted work before the drop commits
+        conn.rollback()
+        drop_cleanup_indexes(conn, indexes)
 
     total_after = conn.execute('SELECT COUNT(*) FROM reviews').fetchone()[0]
     conn.close()
@@ -14,6 +14,8 @@ Usage:
 import argparse
 import re
 import sqlite3
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / 'reviews.db'
@@ -23,16 +25,70 @@ NAME_FIELDS = [
     'reviewer_first_name', 'reviewer_last_name',
 ]
 
+# Every character str.isspace() accepts, for mirroring str.rstrip() with SQL RTRIM
+WHITESPACE = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Temporary expression indexes so the LENGTH() filters in phases 6 and 8 seek
+# instead of scanning; name -> (phase that uses it, expression). Built only
+# for real runs that include those phases, and dropped at the end
+CLEANUP_INDEXES = {
+    'idx_cleanup_author_first_len': (6, 'LENGTH(book_author_first_name)'),
+    'idx_cleanup_reviewer_first_len': (6, 'LENGTH(reviewer_first_name)'),
+    'idx_cleanup_reviewer_last_len': (8, 'LENGTH(reviewer_last_name)'),
+}
+
+
 def get_conn():
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
+    # Offline single-writer run: take the file lock once and keep it until close
+    # (set before WAL, so no shared-memory index is used either)
+    conn.executescript(
+        'PRAGMA locking_mode=EXCLUSIVE; PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; '
+        'PRAGMA temp_store=MEMORY; PRAGMA cache_size=-524288;'
+    )
     return conn
 
 
+def tuple_cursor(conn):
+    """Cursor that returns plain tuples, for per-row loops where sqlite3.Row
+    name lookups add up; unpack the columns in SELECT order."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+def count_or_update(conn, dry_run, assignments, where, params=()):
+    """Apply UPDATE reviews SET <assignments> WHERE <where> and return the
+    number of rows changed; with dry_run, only count the rows it would change."""
+    if dry_run:
+        return conn.execute(f'SELECT COUNT(*) FROM reviews WHERE {where}', params).fetchone()[0]
+    return conn.execute(f'UPDATE reviews SET {assignments} WHERE {where}', params).rowcount
+
+
+def create_cleanup_indexes(conn, phases):
+    """Build the cleanup indexes the given phases use; return their names."""
+    names = [name for name, (phase, _) in CLEANUP_INDEXES.items() if phase in phases]
+    for name in names:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON reviews({CLEANUP_INDEXES[name][1]})')
+    conn.commit()
+    return names
+
+
+def drop_cleanup_indexes(conn, names):
+    for name in names:
+        conn.execute(f'DROP INDEX IF EXISTS {name}')
+    conn.commit()
+
+
 def phase_header(num, name):
     print(f'\n{"="*60}')
     print(f'Phase {num}: {name}')
@@ -48,21 +104,11 @@ def phase1_whitespace_to_null(conn, dry_run):
     phase_header(1, 'Normalize whitespace-only fields to NULL')
     total = 0
     for field in NAME_FIELDS:
-        rows = conn.execute(
-            f"SELECT COUNT(*) as cnt FROM reviews "
-            f"WHERE {field} IS NOT NULL AND TRIM({field}) = ''"
-        ).fetchone()
-        cnt = rows['cnt']
+        where = f"{field} IS NOT NULL AND TRIM({field}) = ''"
+        cnt = count_or_update(conn, dry_run, f"{field} = NULL", where)
         if cnt > 0:
             print(f'  {field}: {cnt} entries')
-            if not dry_run:
-                conn.execute(
-                    f"UPDATE reviews SET {field} = NULL "
-                    f"WHERE {field} IS NOT NULL AND TRIM({field}) = ''"
-                )
             total += cnt
-    if not dry_run and total:
-        conn.commit()
     print(f'Total whitespace→NULL: {total}')
     return total
 
@@ -78,35 +124,18 @@ def phase2_standardize_types(conn, dry_run):
 
     # 2a: Lowercase access_type
     for wrong, correct in [('Open', 'open'), ('Restricted', 'restricted'), ('Paywalled', 'paywalled')]:
-        rows = conn.execute(
-            'SELECT COUNT(*) as cnt FROM reviews WHERE access_type = ?', (wrong,)
-        ).fetchone()
-        cnt = rows['cnt']
+        cnt = count_or_update(conn, dry_run, 'access_type = :correct', 'access_type = :wrong',
+                              {'correct': correct, 'wrong': wrong})
         if cnt > 0:
             print(f'  access_type "{wrong}" → "{correct}": {cnt} entries')
-            if not dry_run:
-                conn.execute(
-                    'UPDATE reviews SET access_type = ? WHERE access_type = ?',
-                    (correct, wrong)
-                )
             total += cnt
 
     # 2b: Empty entry_type → 'review'
-    rows = conn.execute(
-        "SELECT COUNT(*) as cnt FROM reviews WHERE entry_type IS NULL OR entry_type = ''"
-    ).fetchone()
-    cnt = rows['cnt']
+    cnt = count_or_update(conn, dry_run, "entry_type = 'review'", "entry_type IS NULL OR entry_type = ''")
     if cnt > 0:
         print(f'  entry_type empty → "review": {cnt} entries')
-        if not dry_run:
-            conn.execute(
-                "UPDATE reviews SET entry_type = 'review' "
-                "WHERE entry_type IS NULL OR entry_type = ''"
-            )
         total += cnt
 
-    if not dry_run and total:
-        conn.commit()
     print(f'Total type standardizations: {total}')
     return total
 
@@ -120,30 +149,22 @@ def phase3_strip_trailing_commas(conn, dry_run):
     phase_header(3, 'Strip trailing commas from names')
     total = 0
     for field in NAME_FIELDS:
-        rows = conn.execute(
-            f"SELECT id, {field} FROM reviews WHERE {field} LIKE '%,'"
+        # Python's value.rstrip(',').rstrip(), done in SQL
+        stripped = f"RTRIM(RTRIM({field}, ','), :ws)"
+        where = f"{field} GLOB '*,' AND {stripped} != ''"
+        params = {'ws': WHITESPACE}
+        preview = conn.execute(
+            f'SELECT {field}, {stripped} FROM reviews WHERE {where} LIMIT 5', params
         ).fetchall()
-        if not rows:
+        if not preview:
             continue
-        updates = []
-        for r in rows:
-            old = r[field]
-            new = old.rstrip(',').rstrip()
-            if new != old and new:
-                updates.append((new, r['id']))
-        if updates:
-            print(f'  {field}: {len(updates)} entries')
-            for u in updates[:5]:
-                print(f'    "{conn.execute(f"SELECT {field} FROM reviews WHERE id = ?", (u[1],)).fetchone()[0]}" → "{u[0]}"')
-            if len(updates) > 5:
-                print(f'    ... and {len(updates) - 5} more')
-            if not dry_run:
-                conn.executemany(
-                    f'UPDATE reviews SET {field} = ? WHERE id = ?', updates
-                )
-            total += len(updates)
-    if not dry_run and total:
-        conn.commit()
+        cnt = count_or_update(conn, dry_run, f'{field} = {stripped}', where, params)
+        print(f'  {field}: {cnt} entries')
+        for old, new in preview:
+            print(f'    "{old}" → "{new}"')
+        if cnt > 5:
+            print(f'    ... and {cnt - 5} more')
+        total += cnt
     print(f'Total trailing commas stripped: {total}')
     return total
 
@@ -152,120 +173,107 @@ def phase3_strip_trailing_commas(conn, dry_run):
 # Phase 4: Clean "eds."/"ed." from author names
 # ---------------------------------------------------------------------------
 
-ED_SUFFIX_RE = re.compile(r',?\s*\(?\beds\.?\)?\.?$', re.IGNORECASE)
-ED_SINGLE_RE = re.compile(r',?\s*\(?\bed\.?\)?\.?$', re.IGNORECASE)
+# Trailing editor markers in one pass: an "eds." suffix (optionally preceded
+# by an "ed." one), or a lone "ed." suffix followed by any whitespace. Same
+# result as stripping "eds." and then "ed." with a .strip() after each.
+_ED = r',?\s*\(?\bed\.?\)?\.?'
+_EDS = r',?\s*\(?\beds\.?\)?\.?'
+ED_MARKER_RE = re.compile(rf'(?:{_ED}\s*)?{_EDS}$|{_ED}\s*$', re.IGNORECASE)
+AND_SPLIT_RE = re.compile(r'\s+and\s+')
 
 def phase4_clean_editor_markers(conn, dry_run):
     """Strip editor markers and extract first author from multi-author jams."""
     phase_header(4, 'Clean "eds."/"ed." from author names')
     total = 0
 
+    # The [Ee][Dd] GLOB classes match exactly what LIKE's ASCII case folding did
+
     # 4a: Strip eds./ed. from last names
-    rows = conn.execute("""
-        SELECT id, book_author_first_name, book_author_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, book_author_last_name
         FROM reviews
-        WHERE book_author_last_name LIKE '%eds%'
-           OR book_author_last_name LIKE '%ed.'
-           OR book_author_last_name LIKE '%ed)'
-           OR book_author_last_name LIKE '%(ed%'
+        WHERE book_author_last_name GLOB '*[Ee][Dd][Ss]*'
+           OR book_author_last_name GLOB '*[Ee][Dd].'
+           OR book_author_last_name GLOB '*[Ee][Dd])'
+           OR book_author_last_name GLOB '*([Ee][Dd]*'
     """).fetchall()
     updates = []
-    for r in rows:
-        old = r['book_author_last_name']
-        new = ED_SUFFIX_RE.sub('', old).strip()
-        new = ED_SINGLE_RE.sub('', new).strip()
+    for rid, old in rows:
+        new = ED_MARKER_RE.sub('', old).strip()
         if new != old and new:
-            updates.append((new, r['id']))
+            updates.append((new, rid, old))
     if updates:
         print(f'  Last name eds./ed. cleanup: {len(updates)} entries')
-        for u in updates[:5]:
-            row = conn.execute(
-                'SELECT book_author_last_name FROM reviews WHERE id = ?', (u[1],)
-            ).fetchone()
-            print(f'    "{row[0]}" → "{u[0]}"')
+        for new, _, old in updates[:5]:
+            print(f'    "{old}" → "{new}"')
         if len(updates) > 5:
             print(f'    ... and {len(updates) - 5} more')
         if not dry_run:
             conn.executemany(
-                'UPDATE reviews SET book_author_last_name = ? WHERE id = ?', updates
+                'UPDATE reviews SET book_author_last_name = ? WHERE id = ?', [u[:2] for u in updates]
             )
         total += len(updates)
 
     # 4b: Strip eds./ed. from first names
-    rows = conn.execute("""
-        SELECT id, book_author_first_name, book_author_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, book_author_first_name
         FROM reviews
-        WHERE book_author_first_name LIKE '%eds%'
-           OR book_author_first_name LIKE '%ed.'
-           OR book_author_first_name LIKE '%(ed%'
+        WHERE book_author_first_name GLOB '*[Ee][Dd][Ss]*'
+           OR book_author_first_name GLOB '*[Ee][Dd].'
+           OR book_author_first_name GLOB '*([Ee][Dd]*'
     """).fetchall()
     updates = []
-    for r in rows:
-        old = r['book_author_first_name']
-        new = ED_SUFFIX_RE.sub('', old).strip()
-        new = ED_SINGLE_RE.sub('', new).strip()
+    for rid, old in rows:
+        new = ED_MARKER_RE.sub('', old).strip()
         if new != old and new:
-            updates.append((new, r['id']))
+            updates.append((new, rid, old))
     if updates:
         print(f'  First name eds./ed. cleanup: {len(updates)} entries')
-        for u in updates[:5]:
-            row = conn.execute(
-                'SELECT book_author_first_name FROM reviews WHERE id = ?', (u[1],)
-            ).fetchone()
-            print(f'    "{row[0]}" → "{u[0]}"')
+        for new, _, old in updates[:5]:
+            print(f'    "{old}" → "{new}"')
         if len(updates) > 5:
             print(f'    ... and {len(updates) - 5} more')
         if not dry_run:
             conn.executemany(
-                'UPDATE reviews SET book_author_first_name = ? WHERE id = ?', updates
+                'UPDATE reviews SET book_author_first_name = ? WHERE id = ?', [u[:2] for u in updates]
             )
         total += len(updates)
 
     # 4c: Multi-author jams in first name (contains " and ")
     # Only fix when last name has an editor marker — otherwise the " and "
     # is likely part of a book title or organization name in garbled metadata
-    rows = conn.execute("""
+    rows = tuple_cursor(conn).execute("""
         SELECT id, book_author_first_name, book_author_last_name
         FROM reviews
-        WHERE book_author_first_name LIKE '% and %'
-        AND (book_author_last_name LIKE '%eds%'
-             OR book_author_last_name LIKE '%ed.'
-             OR book_author_last_name LIKE '%(ed%')
+        WHERE book_author_first_name GLOB '* and *'
+        AND (book_author_last_name GLOB '*[Ee][Dd][Ss]*'
+             OR book_author_last_name GLOB '*[Ee][Dd].'
+             OR book_author_last_name GLOB '*([Ee][Dd]*')
     """).fetchall()
     updates = []
-    for r in rows:
-        first = r['book_author_first_name']
-        last = r['book_author_last_name']
+    for rid, first, last in rows:
         # Pattern: "Alison M. Jaggar and Iris Marion Young" in first, "eds." in last
         # Extract just the first author's given names
-        parts = re.split(r'\s+and\s+', first, maxsplit=1)
+        parts = AND_SPLIT_RE.split(first, maxsplit=1)
         if len(parts) == 2:
             first_author_given = parts[0].strip()
             words = first_author_given.split()
             if len(words) <= 3:
-                new_first = first_author_given
-                new_first = ED_SUFFIX_RE.sub('', new_first).strip()
-                new_first = ED_SINGLE_RE.sub('', new_first).strip()
+                new_first = ED_MARKER_RE.sub('', first_author_given).strip()
                 if new_first != first and new_first:
-                    updates.append((new_first, r['id']))
+                    updates.append((new_first, rid, first, last))
     if updates:
         print(f'  Multi-author jam cleanup: {len(updates)} entries')
-        for u in updates[:5]:
-            row = conn.execute(
-                'SELECT book_author_first_name, book_author_last_name FROM reviews WHERE id = ?',
-                (u[1],)
-            ).fetchone()
-            print(f'    first="{row[0]}" → "{u[0]}" (last="{row[1]}")')
+        for new_first, _, first, last in updates[:5]:
+            print(f'    first="{first}" → "{new_first}" (last="{last}")')
         if len(updates) > 5:
             print(f'    ... and {len(updates) - 5} more')
         if not dry_run:
             conn.executemany(
-                'UPDATE reviews SET book_author_first_name = ? WHERE id = ?', updates
+                'UPDATE reviews SET book_author_first_name = ? WHERE id = ?', [u[:2] for u in updates]
             )
         total += len(updates)
 
-    if not dry_run and total:
-        conn.commit()
     print(f'Total editor marker fixes: {total}')
     return total
 
@@ -274,6 +282,16 @@ def phase4_clean_editor_markers(conn, dry_run):
 # Phase 5: Fix publisher metadata in author fields
 # ---------------------------------------------------------------------------
 
+# Always metadata, whatever else is in the name; one scan instead of five.
+# The City: alternative is case-sensitive, the rest are not.
+ALWAYS_META_RE = re.compile(
+    r'(?i:University\s+Press|MIT\s+Press|Clarendon\s+Press)'
+    r'|(?:Cambridge|Oxford|Princeton|London|New York|Dordrecht|Leiden):'
+    r'|(?i:\d{4}.*(?:University|Press|Routledge|Springer|Palgrave|Wiley|Blackwell))'
+)
+PUBLISHER_RE = re.compile(r'(?:Routledge|Springer|Palgrave|Macmillan|Wiley)\b', re.IGNORECASE)
+PUBLISHER_META_RE = re.compile(r'\d{4}|pp\.|Vol\.|:\s|,\s*\d')
+
 def _is_publisher_metadata(first, last):
     """Check if the combined author name fields look like publisher metadata.
 
@@ -282,25 +300,15 @@ def _is_publisher_metadata(first, last):
     """
     combined = f"{first or ''} {last or ''}".strip()
 
-    # "University Press" is always metadata (no human is named this)
-    if re.search(r'University\s+Press', combined, re.IGNORECASE):
-        return True
-    # "MIT Press" same
-    if re.search(r'MIT\s+Press', combined, re.IGNORECASE):
-        return True
-    # "Clarendon Press" same
-    if re.search(r'Clarendon\s+Press', combined, re.IGNORECASE):
-        return True
-    # City: Publisher pattern (e.g. "Cambridge: Cambridge", "Oxford: Oxford")
-    if re.search(r'(?:Cambridge|Oxford|Princeton|London|New York|Dordrecht|Leiden):', combined):
-        return True
-    # Contains year + publisher name (e.g. "2024 MatthewCongdon Oxford: ...")
-    if re.search(r'\d{4}.*(?:University|Press|Routledge|Springer|Palgrave|Wiley|Blackwell)', combined, re.IGNORECASE):
+    # "University Press", "MIT Press", "Clarendon Press" (no human is named
+    # this), City: Publisher (e.g. "Cambridge: Cambridge", "Oxford: Oxford"), or
+    # year + publisher name (e.g. "2024 MatthewCongdon Oxford: ...")
+    if ALWAYS_META_RE.search(combined):
         return True
     # Publisher name with additional metadata context (year, pages, city)
-    if re.search(r'(?:Routledge|Springer|Palgrave|Macmillan|Wiley)\b', combined, re.IGNORECASE):
+    if PUBLISHER_RE.search(combined):
         # Only flag if combined has additional metadata signals
-        if re.search(r'\d{4}|pp\.|Vol\.|:\s|,\s*\d', combined):
+        if PUBLISHER_META_RE.search(combined):
             return True
         # Or if it's just the publisher name alone (very short, no given name)
         if combined.strip() in ('Routledge', 'Springer', 'Palgrave', 'Palgrave Macmillan',
@@ -313,35 +321,28 @@ def phase5_publisher_metadata(conn, dry_run):
     """Null out author names that are actually publisher/city metadata."""
     phase_header(5, 'Fix publisher metadata in author fields')
 
-    rows = conn.execute("""
+    # Stream the scan; only the matching rows are kept in memory
+    rows = tuple_cursor(conn).execute("""
         SELECT id, book_author_first_name, book_author_last_name
         FROM reviews
         WHERE book_author_first_name IS NOT NULL
            OR book_author_last_name IS NOT NULL
-    """).fetchall()
+    """)
 
-    updates = []
-    for r in rows:
-        if _is_publisher_metadata(r['book_author_first_name'], r['book_author_last_name']):
-            updates.append(r['id'])
+    updates = [r for r in rows if _is_publisher_metadata(r[1], r[2])]
 
     if updates:
         print(f'  Publisher metadata in author fields: {len(updates)} entries')
-        for uid in updates[:15]:
-            row = conn.execute(
-                'SELECT book_author_first_name, book_author_last_name FROM reviews WHERE id = ?',
-                (uid,)
-            ).fetchone()
-            print(f'    id={uid}: first="{row[0]}" last="{row[1]}" → NULL')
+        for rid, first, last in updates[:15]:
+            print(f'    id={rid}: first="{first}" last="{last}" → NULL')
         if len(updates) > 15:
             print(f'    ... and {len(updates) - 15} more')
         if not dry_run:
             conn.executemany(
                 'UPDATE reviews SET book_author_first_name = NULL, '
                 'book_author_last_name = NULL WHERE id = ?',
-                [(uid,) for uid in updates]
+                [(rid,) for rid, _, _ in updates]
             )
-            conn.commit()
 
     print(f'Total publisher metadata blanked: {len(updates)}')
     return len(updates)
@@ -357,86 +358,82 @@ def phase6_garbled_long_names(conn, dry_run):
     total = 0
 
     # 6a: book_author_first_name > 50 chars (always metadata)
-    rows = conn.execute("""
-        SELECT id, book_author_first_name, book_author_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, book_author_first_name
         FROM reviews
         WHERE LENGTH(book_author_first_name) > 50
     """).fetchall()
     if rows:
         print(f'  book_author_first_name > 50 chars: {len(rows)} entries')
-        for r in rows[:10]:
-            print(f'    id={r["id"]}: "{r["book_author_first_name"][:60]}..." → NULL')
+        for rid, name in rows[:10]:
+            print(f'    id={rid}: "{name[:60]}..." → NULL')
         if len(rows) > 10:
             print(f'    ... and {len(rows) - 10} more')
         if not dry_run:
             conn.executemany(
                 'UPDATE reviews SET book_author_first_name = NULL, '
                 'book_author_last_name = NULL WHERE id = ?',
-                [(r['id'],) for r in rows]
+                [(rid,) for rid, _ in rows]
             )
         total += len(rows)
 
     # 6b: book_author_first_name > 20 chars with digits (embedded metadata)
-    rows = conn.execute("""
-        SELECT id, book_author_first_name, book_author_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, book_author_first_name
         FROM reviews
-        WHERE LENGTH(book_author_first_name) > 20
+        WHERE LENGTH(book_author_first_name) BETWEEN 21 AND 50
         AND book_author_first_name GLOB '*[0-9]*'
-        AND id NOT IN (SELECT id FROM reviews WHERE LENGTH(book_author_first_name) > 50)
     """).fetchall()
     if rows:
         print(f'  book_author_first_name > 20 chars with digits: {len(rows)} entries')
-        for r in rows[:10]:
-            print(f'    id={r["id"]}: "{r["book_author_first_name"][:60]}" → NULL')
+        for rid, name in rows[:10]:
+            print(f'    id={rid}: "{name[:60]}" → NULL')
         if len(rows) > 10:
             print(f'    ... and {len(rows) - 10} more')
         if not dry_run:
             conn.executemany(
                 'UPDATE reviews SET book_author_first_name = NULL, '
                 'book_author_last_name = NULL WHERE id = ?',
-                [(r['id'],) for r in rows]
+                [(rid,) for rid, _ in rows]
             )
         total += len(rows)
 
     # 6c: reviewer names with same patterns
-    rows = conn.execute("""
-        SELECT id, reviewer_first_name, reviewer_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, reviewer_first_name
         FROM reviews
         WHERE LENGTH(reviewer_first_name) > 50
     """).fetchall()
     if rows:
         print(f'  reviewer_first_name > 50 chars: {len(rows)} entries')
-        for r in rows[:5]:
-            print(f'    id={r["id"]}: "{r["reviewer_first_name"][:60]}..." → NULL')
+        for rid, name in rows[:5]:
+            print(f'    id={rid}: "{name[:60]}..." → NULL')
         if not dry_run:
             conn.executemany(
                 'UPDATE reviews SET reviewer_first_name = NULL, '
                 'reviewer_last_name = NULL WHERE id = ?',
-                [(r['id'],) for r in rows]
+                [(rid,) for rid, _ in rows]
             )
         total += len(rows)
 
-    rows = conn.execute("""
-        SELECT id, reviewer_first_name, reviewer_last_name
+    rows = tuple_cursor(conn).execute("""
+        SELECT id, reviewer_first_name
         FROM reviews
-        WHERE LENGTH(reviewer_first_name) > 20
+        WHERE LENGTH(reviewer_first_name) BETWEEN 21 AND 50
         AND reviewer_first_name GLOB '*[0-9]*'
-        AND id NOT IN (SELECT id FROM reviews WHERE LENGTH(reviewer_first_name) > 50)
     """).fetchall()
     if rows:
         print(f'  reviewer_first_name > 20 chars with digits: {len(rows)} entries')
-        for r in rows[:5]:
-            print(f'    id={r["id"]}: "{r["reviewer_first_name"][:60]}" → NULL')
+        for rid, name in rows[:5]:
+            print(f'    id={rid}: "{name[:60]}" → NULL')
         if not dry_run:
             conn.executemany(
                 'UPDATE reviews SET reviewer_first_name = NULL, '
                 'reviewer_last_name = NULL WHERE id = ?',
-                [(r['id'],) for r in rows]
+                [(rid,) for rid, _ in rows]
             )
         total += len(rows)
 
-    if not dry_run and total:
-        conn.commit()
     print(f'Total garbled names blanked: {total}')
     return total
 
@@ -445,69 +442,56 @@ def phase6_garbled_long_names(conn, dry_run):
 # Phase 7: Deduplicate non-symposium entries
 # ---------------------------------------------------------------------------
 
+SCORE_FIELDS = [
+    'book_author_first_name', 'book_author_last_name',
+    'reviewer_first_name', 'reviewer_last_name',
+    'doi', 'review_link', 'review_summary',
+]
+
 def phase7_deduplicate(conn, dry_run):
     """Remove duplicate entries (same book, journal, date) keeping the best one."""
     phase_header(7, 'Deduplicate non-symposium entries')
 
     # Find duplicates: same book_title, publication_source, publication_date
-    # with no symposium_group, and same reviewer (or both NULL)
-    dupes = conn.execute("""
-        SELECT book_title, publication_source, publication_date,
-               GROUP_CONCAT(id) as ids,
-               COUNT(*) as cnt
-        FROM reviews
-        WHERE symposium_group IS NULL
-        GROUP BY book_title, publication_source, publication_date
-        HAVING cnt > 1
+    # with no symposium_group, and same reviewer (or both NULL). Groups with
+    # different reviewers are legitimate multi-reviews and are skipped.
+    # Score entries: more non-NULL fields = better, longer titles preferred.
+    # Each group comes back ranked best-first (ties by id).
+    score_terms = ' + '.join(
+        f"({key} IS NOT NULL AND {key} != '')"
+        for key in SCORE_FIELDS
+    )
+    rows = tuple_cursor(conn).execute(f"""
+        SELECT id, book_title, publication_source, publication_date, score
+        FROM (
+            SELECT id, book_title, publication_source, publication_date, score,
+                   COUNT(*) OVER grp AS n,
+                   MIN(reviewer) OVER grp = MAX(reviewer) OVER grp AS same_reviewer,
+                   ROW_NUMBER() OVER (grp ORDER BY score DESC, id) AS rn
+            FROM (
+                SELECT id, book_title, publication_source, publication_date,
+                       {score_terms} + COALESCE(LENGTH(book_title), 0) / 1000.0 AS score,
+                       COALESCE(reviewer_first_name, '') || char(0) ||
+                       COALESCE(reviewer_last_name, '') AS reviewer
+                FROM reviews
+                WHERE symposium_group IS NULL
+            )
+            WINDOW grp AS (PARTITION BY book_title, publication_source, publication_date)
+        )
+        WHERE n > 1 AND same_reviewer
+        ORDER BY book_title, publication_source, publication_date, rn
     """).fetchall()
 
-    total_deleted = 0
-    for d in dupes:
-        ids = [int(x) for x in d['ids'].split(',')]
-        # Fetch full rows
-        rows = conn.execute(
-            f"SELECT * FROM reviews WHERE id IN ({','.join('?' * len(ids))})",
-            ids
-        ).fetchall()
-
-        # Check if all reviewers are the same (or all NULL)
-        reviewers = set()
-        for r in rows:
-            rev = (r['reviewer_first_name'] or '', r['reviewer_last_name'] or '')
-            reviewers.add(rev)
-        # Skip if different reviewers — legitimate multi-reviews
-        if len(reviewers) > 1:
-            continue
+    delete_ids = []
+    for (book_title, publication_source, publication_date), group in groupby(rows, key=itemgetter(1, 2, 3)):
+        (keep_id, *_, keep_score), *delete = group
+        print(f'  "{book_title[:60]}" | {publication_source} | {publication_date}')
+        print(f'    Keep id={keep_id} (score={keep_score:.1f}), delete {len(delete)}: {[r[0] for r in delete]}')
+        delete_ids.extend((r[0],) for r in delete)
 
-        # Score entries: more non-NULL fields = better
-        def score(row):
-            s = 0
-            for key in ['book_author_first_name', 'book_author_last_name',
-                        'reviewer_first_name', 'reviewer_last_name',
-                        'doi', 'review_link', 'review_summary']:
-                if row[key]:
-                    s += 1
-            # Prefer longer titles
-            if row['book_title']:
-                s += len(row['book_title']) / 1000
-            return s
-
-        scored = sorted(rows, key=score, reverse=True)
-        keep = scored[0]
-        delete = scored[1:]
-
-        if delete:
-            print(f'  "{d["book_title"][:60]}" | {d["publication_source"]} | {d["publication_date"]}')
-            print(f'    Keep id={keep["id"]} (score={score(keep):.1f}), delete {len(delete)}: {[r["id"] for r in delete]}')
-            if not dry_run:
-                conn.executemany(
-                    'DELETE FROM reviews WHERE id = ?',
-                    [(r['id'],) for r in delete]
-                )
-            total_deleted += len(delete)
-
-    if not dry_run and total_deleted:
-        conn.commit()
+    if not dry_run and delete_ids:
+        conn.executemany('DELETE FROM reviews WHERE id = ?', delete_ids)
+    total_deleted = len(delete_ids)
     print(f'Total duplicates removed: {total_deleted}')
     return total_deleted
 
@@ -540,7 +524,6 @@ def phase8_truncated_names(conn, dry_run):
                 'reviewer_last_name = NULL WHERE id = ?',
                 [(r['id'],) for r in rows]
             )
-            conn.commit()
 
     print(f'Total truncated names fixed: {len(rows)}')
     return len(rows)
@@ -586,12 +569,21 @@ def main():
     print(f'Total entries before: {total_before:,}')
 
     results = {}
-    for phase_num in phases_to_run:
-        if phase_num not in PHASES:
-            print(f'Unknown phase {phase_num}, skipping')
-            continue
-        name, func = PHASES[phase_num]
-        results[phase_num] = func(conn, args.dry_run)
+    # A dry run only counts, so building the indexes would cost more than it saves
+    indexes = [] if args.dry_run else create_cleanup_indexes(conn, phases_to_run)
+    try:
+        for phase_num in phases_to_run:
+            if phase_num not in PHASES:
+                print(f'Unknown phase {phase_num}, skipping')
+                continue
+            name, func = PHASES[phase_num]
+            # One transaction per phase: committed when it finishes, rolled back if it raises
+            with conn:
+                if not args.dry_run:
+                    conn.execute('BEGIN IMMEDIATE')
+                results[phase_num] = func(conn, args.dry_run)
+    finally:
+        drop_cleanup_indexes(conn, indexes)
 
     total_after = conn.execute('SELECT COUNT(*) FROM reviews').fetchone()[0]
     conn.close()
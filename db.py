@@ -5,6 +5,7 @@ Single module for all database operations — replaces Airtable.
 
 import sqlite3
 import os
+from typing import Iterable
 
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reviews.db")
 
@@ -33,8 +34,41 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_review_link
 """
 
 
+_INSERT_COLS = (
+    "book_title", "book_author_first_name", "book_author_last_name",
+    "reviewer_first_name", "reviewer_last_name", "publication_source",
+    "publication_date", "review_link", "review_summary", "access_type", "doi",
+    "entry_type", "symposium_group", "subfield_primary", "subfield_secondary",
+)
+_INSERT_SQL = (
+    f"INSERT OR IGNORE INTO reviews ({', '.join(_INSERT_COLS)}) "
+    f"VALUES ({', '.join('?' for _ in _INSERT_COLS)})"
+)
+
+_conn = None
+
+
 def _connect():
-    return sqlite3.connect(DB_PATH)
+    """Return the shared connection, opening it on first use.
+
+    Autocommit mode: single statements commit on their own, and batch
+    writes open an explicit transaction.
+    """
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+        _conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+            "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;"
+        )
+    return _conn
+
+
+def _dict_rows(sql, params=()):
+    """Run a SELECT and return its rows as dicts."""
+    cur = _connect().cursor()
+    cur.row_factory = sqlite3.Row
+    return [dict(r) for r in cur.execute(sql, params).fetchall()]
 
 
 def _migrate(conn):
@@ -54,97 +88,123 @@ def _migrate(conn):
 
 def init_db():
     """Create the reviews table if it doesn't exist."""
-    with _connect() as conn:
-        conn.executescript(_SCHEMA)
-        _migrate(conn)
+    conn = _connect()
+    conn.executescript(_SCHEMA)
+    _migrate(conn)
 
 
 def insert_review(fields: dict):
     """INSERT OR IGNORE a single review."""
-    cols = [
-        "book_title", "book_author_first_name", "book_author_last_name",
-        "reviewer_first_name", "reviewer_last_name", "publication_source",
-        "publication_date", "review_link", "review_summary", "access_type", "doi",
-        "entry_type", "symposium_group", "subfield_primary", "subfield_secondary",
-    ]
-    values = [fields.get(c, "") for c in cols]
-    placeholders = ", ".join("?" for _ in cols)
-    col_names = ", ".join(cols)
-    with _connect() as conn:
-        conn.execute(
-            f"INSERT OR IGNORE INTO reviews ({col_names}) VALUES ({placeholders})",
-            values,
-        )
+    values = [fields.get(c, "") for c in _INSERT_COLS]
+    _connect().execute(_INSERT_SQL, values)
+
+
+def insert_review_if_new(fields: dict) -> bool:
+    """INSERT OR IGNORE a single review; return True if a row was inserted.
+
+    The unique DOI / review_link indexes do the dedup, so callers don't
+    need a doi_exists() / review_link_exists() check first.
+    """
+    values = [fields.get(c, "") for c in _INSERT_COLS]
+    cur = _connect().execute(_INSERT_SQL, values)
+    return cur.rowcount == 1
+
 
+def insert_reviews(records: list[dict]) -> int:
+    """Batch insert reviews (INSERT OR IGNORE).
 
-def insert_reviews(records: list[dict]):
-    """Batch insert reviews (INSERT OR IGNORE)."""
-    cols = [
-        "book_title", "book_author_first_name", "book_author_last_name",
-        "reviewer_first_name", "reviewer_last_name", "publication_source",
-        "publication_date", "review_link", "review_summary", "access_type", "doi",
-        "entry_type", "symposium_group", "subfield_primary", "subfield_secondary",
-    ]
-    placeholders = ", ".join("?" for _ in cols)
-    col_names = ", ".join(cols)
-    rows = [[r.get(c, "") for c in cols] for r in records]
-    with _connect() as conn:
+    Returns the number of rows actually inserted; rows that collide with
+    the unique DOI / review_link indexes are skipped by SQLite.
+    """
+    conn = _connect()
+    with conn:
+        conn.execute("BEGIN")
+        before = conn.total_changes
         conn.executemany(
-            f"INSERT OR IGNORE INTO reviews ({col_names}) VALUES ({placeholders})",
-            rows,
+            _INSERT_SQL,
+            (tuple(r.get(c, "") for c in _INSERT_COLS) for r in records),
         )
+        return conn.total_changes - before
 
 
 def doi_exists(doi: str) -> bool:
-    """Check whether a DOI already exists in the database."""
+    """Check whether a DOI already exists in the database.
+
+    Deprecated: use insert_review_if_new(), or existing_dois() for a batch.
+    """
     if not doi:
         return False
-    with _connect() as conn:
-        row = conn.execute(
-            "SELECT 1 FROM reviews WHERE doi = ? LIMIT 1", (doi,)
-        ).fetchone()
-        return row is not None
+    row = _connect().execute(
+        "SELECT 1 FROM reviews WHERE doi = ? LIMIT 1", (doi,)
+    ).fetchone()
+    return row is not None
 
 
 def review_link_exists(url: str) -> bool:
-    """Check whether a review link already exists in the database."""
+    """Check whether a review link already exists in the database.
+
+    Deprecated: use insert_review_if_new(), or existing_review_links() for a batch.
+    """
     if not url:
         return False
-    with _connect() as conn:
-        row = conn.execute(
-            "SELECT 1 FROM reviews WHERE review_link = ? LIMIT 1", (url,)
-        ).fetchone()
-        return row is not None
+    row = _connect().execute(
+        "SELECT 1 FROM reviews WHERE review_link = ? LIMIT 1", (url,)
+    ).fetchone()
+    return row is not None
+
+
+def _existing_values(col: str, values: Iterable[str]) -> set[str]:
+    """Return the subset of values already present in column col.
+
+    Queries in chunks to stay under SQLite's bound-parameter limit.
+    """
+    values = [v for v in dict.fromkeys(values) if v]
+    found = set()
+    if not values:
+        return found
+    conn = _connect()
+    for i in range(0, len(values), 500):
+        chunk = values[i:i + 500]
+        placeholders = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"SELECT {col} FROM reviews WHERE {col} IN ({placeholders})",
+            chunk,
+        ).fetchall()
+        found.update(r[0] for r in rows)
+    return found
+
+
+def existing_review_links(links: Iterable[str]) -> set[str]:
+    """Return the subset of links that already exist in the database."""
+    return _existing_values("review_link", links)
+
+
+def existing_dois(dois: Iterable[str]) -> set[str]:
+    """Return the subset of DOIs that already exist in the database."""
+    return _existing_values("doi", dois)
 
 
 def get_all_reviews() -> list[dict]:
     """Return every review as a list of dicts."""
-    with _connect() as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute("SELECT * FROM reviews ORDER BY id DESC").fetchall()
-        return [dict(r) for r in rows]
+    return _dict_rows("SELECT * FROM reviews ORDER BY id DESC")
 
 
 def get_reviews_missing_authors() -> list[dict]:
     """Return reviews where both author first and last names are empty."""
-    with _connect() as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM reviews "
-            "WHERE (book_author_first_name IS NULL OR book_author_first_name = '') "
-            "  AND (book_author_last_name IS NULL OR book_author_last_name = '')"
-        ).fetchall()
-        return [dict(r) for r in rows]
+    return _dict_rows(
+        "SELECT * FROM reviews "
+        "WHERE (book_author_first_name IS NULL OR book_author_first_name = '') "
+        "  AND (book_author_last_name IS NULL OR book_author_last_name = '')"
+    )
 
 
 def update_author(review_link: str, first: str, last: str):
     """Update the book author on a review identified by its link."""
-    with _connect() as conn:
-        conn.execute(
-            "UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ? "
-            "WHERE review_link = ?",
-            (first, last, review_link),
-        )
+    _connect().execute(
+        "UPDATE reviews SET book_author_first_name = ?, book_author_last_name = ? "
+        "WHERE review_link = ?",
+        (first, last, review_link),
+    )
 
 
 # Auto-init on import
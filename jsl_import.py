@@ -544,13 +544,12 @@ def main():
         r.pop("_raw_title", None)
 
     # Dedup against existing DB
+    known_dois = db.existing_dois(r["doi"] for r in records)
+    known_links = db.existing_review_links(r["review_link"] for r in records)
     new_records = []
     dupes = 0
     for r in records:
-        if r["doi"] and db.doi_exists(r["doi"]):
-            dupes += 1
-            continue
-        if r["review_link"] and db.review_link_exists(r["review_link"]):
+        if r["doi"] in known_dois or r["review_link"] in known_links:
             dupes += 1
             continue
         new_records.append(r)
@@ -1296,9 +1296,10 @@ class MainstreamReviewScraper:
 
     def _upload(self, reviews):
         """Deduplicate and insert reviews into the database."""
+        known_links = db.existing_review_links(r["review_link"] for r in reviews)
         new_reviews = []
         for r in reviews:
-            if not db.review_link_exists(r["review_link"]):
+            if r["review_link"] not in known_links:
                 new_reviews.append(r)
             else:
                 self.stats["duplicates_skipped"] += 1
@@ -370,10 +370,11 @@ class PhilReviewsScraper:
         if not records:
             return True
 
+        known_dois = db.existing_dois(record.get('DOI') for record in records)
         filtered = []
         for record in records:
             doi = record.get('DOI')
-            if doi and not db.doi_exists(doi):
+            if doi and doi not in known_dois:
                 flag_reason = record.pop('_flag_reason', None)
                 filtered.append(record)
 
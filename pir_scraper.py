@@ -136,12 +136,8 @@ def main():
     print(f'\nTotal reviews scraped: {len(all_records)}')
 
     # Check for existing entries by review_link
-    new_records = []
-    for r in all_records:
-        if r['review_link'] and not db.review_link_exists(r['review_link']):
-            new_records.append(r)
-        elif not r['review_link']:
-            new_records.append(r)
+    known_links = db.existing_review_links(r['review_link'] for r in all_records)
+    new_records = [r for r in all_records if r['review_link'] not in known_links]
 
     print(f'New records (not already in DB): {len(new_records)}')
 
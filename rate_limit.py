@@ -0,0 +1,27 @@
+"""
+Request pacing shared by the scrapers and cleanup scripts.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Spaces calls to wait() at most `rate` per second, shared across threads.
+
+    Unlike sleeping after every N requests, time spent waiting on the network
+    counts towards the interval, so slow responses aren't throttled again.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
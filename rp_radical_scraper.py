@@ -250,7 +250,8 @@ def main():
 
     # Insert
     if not args.dry_run and all_reviews:
-        new_reviews = [r for r in all_reviews if not db.review_link_exists(r['review_link'])]
+        known_links = db.existing_review_links(r['review_link'] for r in all_reviews)
+        new_reviews = [r for r in all_reviews if r['review_link'] not in known_links]
         print(f'\nInserting {len(new_reviews)} new reviews ({len(all_reviews) - len(new_reviews)} duplicates skipped)...')
         if new_reviews:
             db.insert_reviews(new_reviews)
@@ -158,12 +158,8 @@ def main():
     print(f'Scraped {len(records)} reviews')
 
     # Deduplicate by link
-    new = []
-    for r in records:
-        if r['review_link'] and not db.review_link_exists(r['review_link']):
-            new.append(r)
-        elif not r['review_link']:
-            new.append(r)
+    known_links = db.existing_review_links(r['review_link'] for r in records)
+    new = [r for r in records if r['review_link'] not in known_links]
 
     print(f'New records: {len(new)}')
 
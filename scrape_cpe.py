@@ -192,10 +192,11 @@ def scrape_all():
 
     if all_records:
         # Check for duplicates
+        known_links = db.existing_review_links(r['review_link'] for r in all_records)
         existing = 0
         new_records = []
         for r in all_records:
-            if r['review_link'] and db.review_link_exists(r['review_link']):
+            if r['review_link'] in known_links:
                 existing += 1
             else:
                 new_records.append(r)
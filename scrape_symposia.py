@@ -554,12 +554,12 @@ def scrape_journal(journal_name):
 
 def insert_records(records):
     """Insert symposium records into the database, skipping existing ones."""
+    known_dois = db.existing_dois(r['doi'] for r in records)
+    known_links = db.existing_review_links(r['review_link'] for r in records)
     existing = 0
     new_records = []
     for r in records:
-        if r['doi'] and db.doi_exists(r['doi']):
-            existing += 1
-        elif r['review_link'] and db.review_link_exists(r['review_link']):
+        if r['doi'] in known_dois or r['review_link'] in known_links:
             existing += 1
         else:
             new_records.append(r)
@@ -205,15 +205,15 @@ def scan_journal_batch(journal_name: str, issn: str, start: int,
                 doi = parsed["doi"]
                 link = parsed["review_link"]
 
-                if doi and db.doi_exists(doi):
-                    continue
-                if link and db.review_link_exists(link):
-                    continue
-
                 if dry_run:
+                    if doi and db.doi_exists(doi):
+                        continue
+                    if link and db.review_link_exists(link):
+                        continue
                     log.info(f"  [DRY RUN] Would add: {parsed['book_title'][:60]}")
                 else:
-                    db.insert_review(parsed)
+                    if not db.insert_review_if_new(parsed):
+                        continue
                     log.info(f"  Added: {parsed['book_title'][:60]}")
                 new_reviews += 1
 
@@ -315,14 +315,15 @@ def run_incremental_scan(state: dict, dry_run: bool = False):
                     continue
                 doi = parsed["doi"]
                 link = parsed["review_link"]
-                if doi and db.doi_exists(doi):
-                    continue
-                if link and db.review_link_exists(link):
-                    continue
                 if dry_run:
+                    if doi and db.doi_exists(doi):
+                        continue
+                    if link and db.review_link_exists(link):
+                        continue
                     log.info(f"  [DRY RUN] Would add: {parsed['book_title'][:60]}")
                 else:
-                    db.insert_review(parsed)
+                    if not db.insert_review_if_new(parsed):
+                        continue
                     log.info(f"  Added: {parsed['book_title'][:60]}")
                 total_new += 1
 
@@ -344,14 +345,14 @@ def run_incremental_scan(state: dict, dry_run: bool = False):
                         continue
                     doi = parsed["doi"]
                     link = parsed["review_link"]
-                    if doi and db.doi_exists(doi):
-                        continue
-                    if link and db.review_link_exists(link):
-                        continue
                     if dry_run:
+                        if doi and db.doi_exists(doi):
+                            continue
+                        if link and db.review_link_exists(link):
+                            continue
                         log.info(f"  [DRY RUN] Would add: {parsed['book_title'][:60]}")
-                    else:
-                        db.insert_review(parsed)
+                    elif not db.insert_review_if_new(parsed):
+                        continue
                     total_new += 1
                 start += 10
                 time.sleep(1.2)
@@ -123,25 +123,25 @@ def check_journal(scraper: CrossrefReviewScraper, journal_name: str,
         if not extracted:
             continue
 
-        doi = extracted.get("DOI", "")
-        link = extracted.get("Review Link", "")
-
-        # Skip if already in DB
-        if doi and db.doi_exists(doi):
-            continue
-        if link and db.review_link_exists(link):
-            continue
-
         # Convert Airtable-style keys to DB column names
         db_record = _to_db_fields(extracted)
         title = db_record.get("book_title", "?")
 
         if dry_run:
+            # Skip if already in DB
+            doi = extracted.get("DOI", "")
+            link = extracted.get("Review Link", "")
+            if doi and db.doi_exists(doi):
+                continue
+            if link and db.review_link_exists(link):
+                continue
             log.info(f"    [DRY RUN] Would add: {title}")
             new_count += 1
             continue
 
-        db.insert_review(db_record)
+        # The unique DOI / link indexes skip entries already in the DB
+        if not db.insert_review_if_new(db_record):
+            continue
         new_count += 1
         log.info(f"    Added: {title}")
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test data_cleanup_full.iter_crossref against simulated Crossref outages.
+No network: the batch and single-DOI fetchers and the response cache are
+swapped for in-memory stand-ins.
+"""
+
+import contextlib
+import io
+
+import data_cleanup_full as dcf
+
+
+@contextlib.contextmanager
+def crossref_stub(batch, work, cache=None, batch_size=3, max_errors=4):
+    """Swap in fake fetchers and an in-memory cache for the duration."""
+    cache = dict(cache or {})
+    saved = {name: getattr(dcf, name) for name in (
+        'fetch_crossref_batch', 'fetch_crossref_work', 'cache_lookup', 'cache_store',
+        'CROSSREF_BATCH', 'MAX_ERRORS')}
+    dcf.fetch_crossref_batch = batch
+    dcf.fetch_crossref_work = work
+    dcf.cache_lookup = lambda dois: {d.lower(): cache[d.lower()] for d in dois if d.lower() in cache}
+    dcf.cache_store = cache.update
+    dcf.CROSSREF_BATCH = batch_size
+    dcf.MAX_ERRORS = max_errors
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(dcf, name, value)
+
+
+def make_rows(n):
+    return [{'id': i, 'doi': f'10.1/{i}'} for i in range(n)]
+
+
+def fail(*args):
+    raise RuntimeError('Crossref is down')
+
+
+def test_outage_aborts():
+    """Batch and single-DOI lookups all fail: CrossrefAborted, never KeyError."""
+    print("\n--- Crossref outage ---")
+    rows = make_rows(60)
+    # Every third DOI is cached, so cached rows sit between the failing ones
+    cached = {r['doi']: {'DOI': r['doi']} for r in rows[::3]}
+
+    passed = 0
+    for attempt in range(20):
+        yielded = []
+        with crossref_stub(fail, fail, cache=cached):
+            try:
+                for r, data in dcf.iter_crossref(rows):
+                    yielded.append(r)
+                outcome = 'finished'
+            except dcf.CrossrefAborted:
+                outcome = 'aborted'
+            except Exception as e:
+                outcome = f'{type(e).__name__}: {e}'
+        in_order = yielded == rows[:len(yielded)]
+        if outcome == 'aborted' and in_order:
+            passed += 1
+        else:
+            print(f"  FAIL (attempt {attempt}): {outcome}, {len(yielded)} rows, in order: {in_order}")
+    print(f"  {passed}/20 runs aborted cleanly")
+    assert passed == 20
+
+
+def test_some_failures_yield_every_row():
+    """Fewer than MAX_ERRORS failures: every row comes back once, in order."""
+    print("\n--- Scattered failures ---")
+    rows = make_rows(30)
+    cached = {r['doi']: {'DOI': r['doi']} for r in rows[::4]}
+
+    def work(doi):
+        if doi.endswith('7'):
+            raise RuntimeError('timeout')
+        return {'DOI': doi}
+
+    with crossref_stub(lambda dois: {}, work, cache=cached, max_errors=10):
+        got = list(dcf.iter_crossref(rows))
+
+    ok = [r for r, _ in got] == rows
+    errors = sum(isinstance(data, Exception) for _, data in got)
+    print(f"  {'PASS' if ok else 'FAIL'}: {len(got)}/{len(rows)} rows, {errors} errors")
+    assert ok and errors == 3
+
+
+def test_phase_loop_reports_unchecked():
+    """crossref_results reports the rows an abort left unchecked."""
+    print("\n--- Abort reporting ---")
+    rows = make_rows(40)
+    out = io.StringIO()
+    with crossref_stub(fail, fail), contextlib.redirect_stdout(out):
+        seen = sum(1 for _ in dcf.crossref_results(rows))
+    report = out.getvalue()
+    expected = f'{len(rows) - seen} entries not checked'
+    ok = 'Too many errors' in report and expected in report
+    print(f"  {'PASS' if ok else 'FAIL'}: {report.strip()}")
+    assert ok
+
+
+if __name__ == '__main__':
+    print("data_cleanup_full Crossref iteration tests")
+    print("=" * 50)
+
+    test_outage_aborts()
+    test_some_failures_yield_every_row()
+    test_phase_loop_reports_unchecked()